@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from .core.cc_surface.api import (
-    compute_verdict, analyze_composition, fh_bounds, backend_info, format_verdict
-)
+__all__ = ["compute_verdict", "analyze_composition", "fh_bounds", "backend_info", "format_verdict"]
+
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    from .core.cc_surface.api import (
+        compute_verdict, analyze_composition, fh_bounds, backend_info, format_verdict
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy exports: `import gce` stays cheap, and pydantic plus the
+    # optional cc-framework probe are only paid once an API helper is used.
+    if name in __all__:
+        from .core.cc_surface import api
 
-__all__ = ["compute_verdict", "analyze_composition", "fh_bounds", "backend_info", "format_verdict"]
\ No newline at end of file
+        value = getattr(api, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,36 @@
+"""
+JSON encoding for plain-dict payloads.
+
+Uses `orjson` when it is installed (`pip install gce[fast]`) and the stdlib
+`json` module otherwise. Pydantic models should keep using their own
+`model_dump_json()`, which is already backed by pydantic-core's encoder; this
+helper is for envelopes assembled from dicts (e.g. the JSON export).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - depends on the optional `fast` extra
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["dumps"]
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """
+    Serialise `obj` to a JSON string, optionally indented by two spaces.
+
+    Non-string dict keys are stringified in both code paths, matching
+    `json.dumps`. Note that orjson leaves non-ASCII characters unescaped,
+    which is still valid JSON.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None)
@@ -12,46 +12,147 @@ This keeps tests and offline usage safe while giving you a real AI feature
 when OPENAI_API_KEY is configured.
 """
 
-import json
+import asyncio
 import os
-from typing import Optional
-
-from openai import OpenAI  # type: ignore[import-untyped]
+import re
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
 
 from .core.cc_surface.api import RunBundle, Verdict
 
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    from openai import AsyncOpenAI, OpenAI  # type: ignore[import-untyped]
+    from openai.types.chat import ChatCompletionSystemMessageParam  # type: ignore[import-untyped]
+
 # Default model; can be overridden via env var GCE_AI_MODEL.
 _DEFAULT_MODEL = os.getenv("GCE_AI_MODEL", "gpt-4.1-mini")
 
-_client: Optional[OpenAI] = None
+_DEFAULT_TIMEOUT_S = 8.0
+
+
+def _timeout_from_env() -> float:
+    """
+    Read GCE_AI_TIMEOUT (seconds), falling back to the default when it is
+    unset, not a number, or not a positive finite value. A bad setting must
+    never stop this module from importing.
+    """
+    raw = os.getenv("GCE_AI_TIMEOUT")
+    if raw is None:
+        return _DEFAULT_TIMEOUT_S
+    try:
+        value = float(raw)
+    except ValueError:
+        return _DEFAULT_TIMEOUT_S
+    return value if 0.0 < value < float("inf") else _DEFAULT_TIMEOUT_S
+
+
+# Per-request deadline in seconds; can be overridden via env var GCE_AI_TIMEOUT.
+# The openai defaults (600 s, retried twice) would let a hung provider stall a
+# UI worker for half an hour. A timed-out call raises like any other API error
+# and takes the usual offline fallback.
+_REQUEST_TIMEOUT_S = _timeout_from_env()
+_MAX_RETRIES = 1
+
+# Set GCE_AI_PRETTY_PROMPT=1 to indent the JSON embedded in prompts (debugging).
+_PROMPT_JSON_INDENT: Optional[int] = 2 if os.getenv("GCE_AI_PRETTY_PROMPT") else None
+
+
+def _json_dumper(model_cls: type) -> Callable[[Any], str]:
+    """
+    Resolve a compact JSON serialiser for `model_cls` once, at import time.
+
+    For Pydantic models this binds pydantic-core's `to_json` directly, which
+    skips `model_dump_json`'s per-call argument handling (a hoisted
+    `TypeAdapter` wraps the same serializer and measured no faster). Other
+    backends fall back to their own `model_dump_json`.
+    """
+    serializer = getattr(model_cls, "__pydantic_serializer__", None)
+    if serializer is None:  # pragma: no cover - non-pydantic backend models
+        return lambda obj: obj.model_dump_json(indent=_PROMPT_JSON_INDENT, exclude_none=True)
+    to_json = serializer.to_json
+    return lambda obj: to_json(obj, indent=_PROMPT_JSON_INDENT, exclude_none=True).decode()
+
+
+_dump_bundle_json = _json_dumper(RunBundle)
+_dump_verdict_json = _json_dumper(Verdict)
+
+_SYSTEM_PERSONA = (
+    "You are a concise, technically-accurate guardrail "
+    "composability coach. Respond in Markdown."
+)
+
+# Prompt-invariant system message, shared by every request. Keeping it
+# byte-identical also lets providers with prefix caching reuse its tokens.
+_SYSTEM_MSG: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": _SYSTEM_PERSONA,
+}
+
+# Batched variant: same persona, plus the per-case output contract that
+# `explain_batch` relies on when splitting the response.
+_BATCH_SYSTEM_MSG: ChatCompletionSystemMessageParam = {
+    "role": "system",
+    "content": (
+        _SYSTEM_PERSONA + " Return one Markdown section per case, "
+        "headed `## Case <n>`, in the order the cases are given."
+    ),
+}
+
+# Upper bound on cases packed into a single chat completion.
+_MAX_BATCH = 8
 
+_CASE_HEADING = re.compile(r"^##\s*Case\s+\d+\s*$", re.MULTILINE)
 
+# Upper bound on in-flight requests for `gather_explanations`.
+_MAX_CONCURRENCY = 8
+
+
+@cache
 def _get_client() -> Optional[OpenAI]:
     """
     Lazily construct an OpenAI client if an API key is available.
 
+    The openai package is only imported here, after the API key check, so the
+    offline path never pays its import cost.
+
     Returns None if:
     - the openai package is not usable, or
     - OPENAI_API_KEY is not set, or
     - client construction fails for any reason.
 
+    The outcome (client or None) is computed once per process; call
+    `_get_client.cache_clear()` to re-read the environment (e.g. in tests).
+
     This ensures importing this module never crashes tests.
     """
-    global _client
-    if _client is not None:
-        return _client
-
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         # No key = operate in offline/fallback mode.
         return None
 
     try:
-        _client = OpenAI()
+        from openai import OpenAI  # type: ignore[import-untyped]
+
+        return OpenAI(timeout=_REQUEST_TIMEOUT_S, max_retries=_MAX_RETRIES)
     except Exception:
         # Fail closed: treat as unavailable rather than crashing.
-        _client = None
-    return _client
+        return None
+
+
+@cache
+def _get_async_client() -> Optional[AsyncOpenAI]:
+    """
+    Async counterpart of `_get_client`, with the same None-on-failure contract.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        return None
+
+    try:
+        from openai import AsyncOpenAI  # type: ignore[import-untyped]
+
+        return AsyncOpenAI(timeout=_REQUEST_TIMEOUT_S, max_retries=_MAX_RETRIES)
+    except Exception:
+        return None
 
 
 def _fallback_explanation(bundle: RunBundle, verdict: Verdict) -> str:
@@ -79,15 +180,11 @@ def _fallback_explanation(bundle: RunBundle, verdict: Verdict) -> str:
     )
 
 
-def _build_prompt(bundle: RunBundle, verdict: Verdict) -> str:
-    """
-    Build a compact JSON-based prompt for the LLM.
+# Default length cap written into the prompt's requirements.
+_MAX_WORDS = 250
 
-    We keep it structured so it's easy to debug and reason about.
-    """
-    bundle_data = bundle.model_dump()
-    verdict_data = verdict.model_dump()
 
+def _prompt_preamble(max_words: int) -> str:
     return (
         "You are an expert safety-engineering coach for AI guardrail composition.\n"
         "Given a run bundle (experiment settings) and a verdict (label + CC metric), "
@@ -97,10 +194,89 @@ def _build_prompt(bundle: RunBundle, verdict: Verdict) -> str:
         "- Start with a short 2–3 sentence summary.\n"
         "- Then provide 3–5 bullet points with concrete insights.\n"
         "- End with 1–2 suggested next tests.\n"
-        "- Keep it under 250 words.\n\n"
-        f"RunBundle JSON:\n{json.dumps(bundle_data, indent=2)}\n\n"
-        f"Verdict JSON:\n{json.dumps(verdict_data, indent=2)}\n"
+        f"- Keep it under {max_words} words.\n\n"
+    )
+
+
+_PROMPT_PREAMBLE = _prompt_preamble(_MAX_WORDS)
+
+# Single-case prompt: the static text is assembled once; each call only fills
+# in the two JSON blobs.
+_PROMPT_BODY = "RunBundle JSON:\n{bundle}\n\nVerdict JSON:\n{verdict}\n"
+_PROMPT_TEMPLATE = _PROMPT_PREAMBLE + _PROMPT_BODY
+
+
+def _build_prompt(bundle: RunBundle, verdict: Verdict, max_words: int = _MAX_WORDS) -> str:
+    """
+    Build a compact JSON-based prompt for the LLM.
+
+    We keep it structured so it's easy to debug and reason about. The models
+    are serialised by Pydantic's native JSON encoder (see `_json_dumper`), so
+    no intermediate dict is built; compact output also keeps the prompt's
+    token count down. A non-default `max_words` rebuilds the preamble.
+    """
+    template = (
+        _PROMPT_TEMPLATE
+        if max_words == _MAX_WORDS
+        else _prompt_preamble(max_words) + _PROMPT_BODY
+    )
+    return template.format(
+        bundle=_dump_bundle_json(bundle),
+        verdict=_dump_verdict_json(verdict),
+    )
+
+
+def _build_batch_prompt(pairs: Sequence[Tuple[RunBundle, Verdict]]) -> str:
+    """
+    Pack several (RunBundle, Verdict) pairs into one prompt, one numbered
+    `### Case <n>` block per pair. The requirements apply to each case.
+    """
+    blocks = [
+        f"### Case {idx}\n"
+        f"RunBundle: {_dump_bundle_json(bundle)}\n"
+        f"Verdict: {_dump_verdict_json(verdict)}"
+        for idx, (bundle, verdict) in enumerate(pairs, 1)
+    ]
+    return _PROMPT_PREAMBLE + "\n\n".join(blocks) + "\n"
+
+
+def _split_cases(content: str, expected: int) -> Optional[List[str]]:
+    """
+    Split a batched response on its `## Case <n>` headings.
+
+    Returns None when the number of sections does not match `expected`, so the
+    caller can fall back to one request per case instead of misattributing text.
+    """
+    sections = [part.strip() for part in _CASE_HEADING.split(content)[1:]]
+    if len(sections) != expected:
+        return None
+    return sections
+
+
+@lru_cache(maxsize=256)
+def _complete(prompt: str, n_cases: int = 1) -> str:
+    """
+    Send one chat completion for `prompt` and return the stripped Markdown.
+
+    The prompt embeds the full RunBundle + Verdict JSON, so caching on it is an
+    exact-match cache: re-explaining an identical result skips the network
+    round-trip. Exceptions are not cached, so failed calls are retried.
+    Callers must check `_get_client()` first.
+
+    With ``n_cases > 1`` the batched system message is used and the token
+    budget and request timeout scale with the number of cases.
+    """
+    client = _get_client()
+    system_msg = _SYSTEM_MSG if n_cases == 1 else _BATCH_SYSTEM_MSG
+    completion = client.chat.completions.create(  # type: ignore[union-attr]
+        model=_DEFAULT_MODEL,
+        messages=[system_msg, {"role": "user", "content": prompt}],
+        temperature=0.3,
+        max_tokens=400 * n_cases,
+        timeout=_REQUEST_TIMEOUT_S * n_cases,
     )
+    content = completion.choices[0].message.content or ""
+    return content.strip()
 
 
 def explain_with_ai(bundle: RunBundle, verdict: Verdict) -> str:
@@ -117,24 +293,126 @@ def explain_with_ai(bundle: RunBundle, verdict: Verdict) -> str:
     prompt = _build_prompt(bundle, verdict)
 
     try:
-        completion = client.chat.completions.create(
+        return _complete(prompt)
+    except Exception as exc:  # pragma: no cover - defensive
+        # Never let API issues crash the app; fall back with context.
+        return _failure_explanation(bundle, verdict, exc)
+
+
+def explain_verdict(
+    bundle: RunBundle,
+    verdict: Verdict,
+    max_words: int = 220,
+) -> Tuple[str, str]:
+    """
+    Entry point for the Gradio coach panel: return ``(markdown, mode)``.
+
+    - ``mode == "online-llm"``: the chat model's answer, capped at
+      `max_words` words by the prompt.
+    - ``mode == "offline-fallback"``: no OpenAI client is configured, so the
+      deterministic `_fallback_explanation` is returned instead.
+
+    Unlike `explain_with_ai`, API errors (including the per-request timeout)
+    are raised rather than folded into the text, so the UI can label its own
+    offline fallback.
+    """
+    if _get_client() is None:
+        return _fallback_explanation(bundle, verdict), "offline-fallback"
+    return _complete(_build_prompt(bundle, verdict, max_words)), "online-llm"
+
+
+def _failure_explanation(bundle: RunBundle, verdict: Verdict, exc: Exception) -> str:
+    base = _fallback_explanation(bundle, verdict)
+    return f"{base}\n\n_AI call failed; falling back to offline explanation._\n\nDetails: `{exc}`"
+
+
+async def explain_with_ai_async(bundle: RunBundle, verdict: Verdict) -> str:
+    """
+    Non-blocking variant of `explain_with_ai` built on `AsyncOpenAI`.
+
+    Same prompt, fallback, and error handling as the sync path. Responses are
+    not shared with the sync path's completion cache.
+    """
+    client = _get_async_client()
+    if client is None:
+        return _fallback_explanation(bundle, verdict)
+
+    prompt = _build_prompt(bundle, verdict)
+
+    try:
+        completion = await client.chat.completions.create(
             model=_DEFAULT_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are a concise, technically-accurate guardrail "
-                        "composability coach. Respond in Markdown."
-                    ),
-                },
-                {"role": "user", "content": prompt},
-            ],
+            messages=[_SYSTEM_MSG, {"role": "user", "content": prompt}],
             temperature=0.3,
             max_tokens=400,
         )
         content = completion.choices[0].message.content or ""
         return content.strip()
     except Exception as exc:  # pragma: no cover - defensive
-        # Never let API issues crash the app; fall back with context.
-        base = _fallback_explanation(bundle, verdict)
-        return f"{base}\n\n_AI call failed; falling back to offline explanation._\n\nDetails: `{exc}`"
+        return _failure_explanation(bundle, verdict, exc)
+
+
+async def gather_explanations(
+    pairs: Sequence[Tuple[RunBundle, Verdict]],
+    *,
+    max_concurrency: int = _MAX_CONCURRENCY,
+) -> List[str]:
+    """
+    Explain many (RunBundle, Verdict) pairs concurrently, in input order.
+
+    At most `max_concurrency` requests are in flight at once, so total latency
+    is roughly ceil(N / max_concurrency) round-trips instead of N. From sync
+    code, call ``asyncio.run(gather_explanations(pairs))``.
+    """
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def _one(bundle: RunBundle, verdict: Verdict) -> str:
+        async with semaphore:
+            return await explain_with_ai_async(bundle, verdict)
+
+    return list(await asyncio.gather(*(_one(bundle, verdict) for bundle, verdict in pairs)))
+
+
+def explain_batch(
+    pairs: Sequence[Tuple[RunBundle, Verdict]],
+    *,
+    batch_size: int = _MAX_BATCH,
+) -> List[str]:
+    """
+    Explain many (RunBundle, Verdict) pairs with as few LLM calls as possible.
+
+    Pairs are packed `batch_size` at a time (capped at `_MAX_BATCH`) into a
+    single chat completion, so the system prompt and request overhead are paid
+    once per batch rather than once per pair. Results come back in input order.
+
+    - Without an OpenAI client, every pair gets the offline explanation.
+    - If a batched call fails or its response cannot be split into exactly one
+      section per case, that batch is retried pair-by-pair via
+      `explain_with_ai`, which carries its own fallback handling.
+    """
+    client = _get_client()
+    if client is None:
+        return [_fallback_explanation(bundle, verdict) for bundle, verdict in pairs]
+
+    size = max(1, min(int(batch_size), _MAX_BATCH))
+    results: List[str] = []
+
+    for start in range(0, len(pairs), size):
+        chunk = pairs[start : start + size]
+        if len(chunk) == 1:
+            results.append(explain_with_ai(*chunk[0]))
+            continue
+
+        sections: Optional[List[str]]
+        try:
+            content = _complete(_build_batch_prompt(chunk), len(chunk))
+            sections = _split_cases(content, len(chunk))
+        except Exception:  # pragma: no cover - defensive
+            sections = None
+
+        if sections is None:
+            results.extend(explain_with_ai(bundle, verdict) for bundle, verdict in chunk)
+        else:
+            results.extend(sections)
+
+    return results
@@ -10,29 +10,38 @@ Two main entry points (also exposed as console scripts via pyproject.toml):
 
 You can also run:
 
+    gce
     python -m gce.cli
 
 to use the Typer-powered multi-command interface.
+
+Startup cost matters for a CLI, so this module only imports `sys` at the top
+level. Typer and the cc-surface API (pydantic + optional cc-framework) are
+imported inside the functions that actually need them, and `main()` answers
+`--help` / `--version` without importing either.
 """
 
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any, List, Optional
 
-import typer
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    import typer
 
-from gce.core.cc_surface.api import backend_info, compute_verdict_from_params
+_APP_HELP = "Guardrail Composability Explorer (GCE) CLI utilities."
 
-app = typer.Typer(help="Guardrail Composability Explorer (GCE) CLI utilities.")
+# Static usage text for the `--help` fast path. Keep in sync with `build_app()`.
+_USAGE = f"""Usage: gce [OPTIONS] COMMAND [ARGS]...
 
+  {_APP_HELP}
 
-@app.command("backend-info")
-def backend_info_cli() -> None:
-    """
-    Typer command: print information about the active backend.
+Options:
+  --version  Show the GCE version and exit.
+  --help     Show this message and exit.
 
-    This is a thin wrapper over `print_backend_info`, which is also used as the
-    console-script entry point (`gce-backend-info`).
-    """
-    print_backend_info()
+Commands:
+  backend-info   Print information about the active backend.
+  cc-quickcheck  Run a tiny CC smoke test and print the verdict as JSON.
+"""
 
 
 def print_backend_info() -> None:
@@ -41,25 +50,14 @@ def print_backend_info() -> None:
 
     Prints a small key → value listing of the active backend configuration.
     """
+    from gce.core.cc_surface.api import backend_info
+
     info = backend_info()
     for key, value in info.items():
         print(f"{key}: {value}")
 
 
-@app.command("cc-quickcheck")
-def cc_quickcheck_cli() -> None:
-    """
-    Typer command: run a tiny CC smoke test and print the verdict as JSON.
-
-    This mirrors the `cc_quickcheck` console-script entry point (`gce-cc-quickcheck`)
-    but is wired into the Typer app so it can be invoked via:
-
-        python -m gce.cli cc-quickcheck
-    """
-    cc_quickcheck()
-
-
-def cc_quickcheck() -> None:
+def cc_quickcheck(pretty: Optional[bool] = None) -> None:
     """
     Console-script entry for `gce-cc-quickcheck`.
 
@@ -69,8 +67,14 @@ def cc_quickcheck() -> None:
     - One composed configuration
     - objective = "minimize" (smaller J is better)
 
-    and prints the resulting Verdict as pretty-printed JSON.
+    and prints the resulting Verdict as JSON.
+
+    Output is indented when `pretty` is True and compact (one line) when it is
+    False. The default (None) pretty-prints only for an interactive terminal,
+    so scripts piping the output get the cheaper compact form.
     """
+    from gce.core.cc_surface.api import compute_verdict_from_params
+
     verdict = compute_verdict_from_params(
         theta=0.5,
         patterns=["demo"],
@@ -80,11 +84,85 @@ def cc_quickcheck() -> None:
         objective="minimize",
     )
 
+    if pretty is None:
+        pretty = sys.stdout.isatty()
+
     # Pydantic v2: model_dump_json returns a JSON string
-    json_blob: str = verdict.model_dump_json(indent=2)  # type: ignore[assignment]
-    print(json_blob)
+    json_blob: str = verdict.model_dump_json(indent=2 if pretty else None)  # type: ignore[assignment]
+    sys.stdout.write(json_blob)
+    sys.stdout.write("\n")
+
+
+def build_app() -> typer.Typer:
+    """
+    Construct the Typer multi-command app.
+
+    Typer is imported here rather than at module import time so that the
+    console-script entry points above never pay for it.
+    """
+    import typer
+
+    app = typer.Typer(help=_APP_HELP)
+
+    @app.command("backend-info")
+    def backend_info_cli() -> None:
+        """
+        Print information about the active backend.
+
+        This is a thin wrapper over `print_backend_info`, which is also used as the
+        console-script entry point (`gce-backend-info`).
+        """
+        print_backend_info()
+
+    @app.command("cc-quickcheck")
+    def cc_quickcheck_cli(
+        pretty: Optional[bool] = typer.Option(
+            None,
+            "--pretty/--no-pretty",
+            help="Indent the JSON output (default: only when writing to a terminal).",
+        ),
+    ) -> None:
+        """
+        Run a tiny CC smoke test and print the verdict as JSON.
+
+        This mirrors the `cc_quickcheck` console-script entry point (`gce-cc-quickcheck`)
+        but is wired into the Typer app so it can be invoked via:
+
+            python -m gce.cli cc-quickcheck
+        """
+        cc_quickcheck(pretty=pretty)
+
+    return app
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Console-script entry for `gce` (and `python -m gce.cli`).
+
+    `--help` and `--version` are answered from static strings; anything else is
+    handed to the Typer app built by `build_app()`.
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    if not args or args in (["--help"], ["-h"]):
+        print(_USAGE, end="")
+        return
+    if args == ["--version"]:
+        from gce import __version__
+
+        print(__version__)
+        return
+
+    build_app()(args=args, prog_name="gce")
+
+
+def __getattr__(name: str) -> Any:  # pragma: no cover - compatibility shim
+    # `gce.cli.app` used to be a module-level Typer instance; build it on demand.
+    if name == "app":
+        return build_app()
+    raise AttributeError(name)
 
 
 if __name__ == "__main__":
     # When invoked as `python -m gce.cli`, run the Typer multi-command app.
-    app()
+    main()
@@ -13,14 +13,48 @@ This module is intentionally thin:
   - a local "fallback" backend implemented in `gce.core.cc_surface`, and
   - the optional `cc-framework` backend (`cc.core.api`) when installed.
 
+  Set ``GCE_BACKEND=fallback`` to skip the cc-framework probe entirely, or
+  ``GCE_BACKEND=cc-framework`` to attempt it even when the package cannot be
+  located up front. The default (``auto``) only attempts the import when a
+  top-level ``cc`` package is found on ``sys.path``.
+
 The goal is that downstream tooling (CLI, UI, notebooks, reports) can treat
 this as a stable facade, without needing to care which backend is active.
 """
 
+import math
+import os
 from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, Mapping, Tuple, Literal, cast
-
-from .composition import compute_cc, classify_cc
+from importlib.util import find_spec
+from itertools import islice
+from functools import cache, lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from .composition import (
+    Objective,
+    _VECTORIZE_MIN_BASELINES,
+    _best_finite_value,
+    _cc_from_best,
+    compute_cc,
+    compute_cc_vec,
+    classify_cc,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    import numpy as np
 
 # Label type used in the fallback backend
 Label = Literal["Constructive", "Independent", "Destructive"]
@@ -34,11 +68,29 @@ _BACKEND_PROVIDER = "gce.core.cc_surface"
 # Backend selection: cc-framework (optional) vs local fallback
 # ---------------------------------------------------------------------------
 
+
+def _should_probe_cc() -> bool:
+    """
+    Decide whether importing `cc.core.api` is worth attempting.
+
+    A failed import walks the whole import machinery before raising; a
+    top-level `find_spec("cc")` is a single path search and imports nothing.
+    """
+    requested = os.environ.get("GCE_BACKEND", "auto").strip().lower()
+    if requested == "fallback":
+        return False
+    if requested == "cc-framework":
+        return True
+    return find_spec("cc") is not None
+
+
 try:  # pragma: no cover - exercised indirectly via tests / real environments
     # Preferred backend: cc-framework (if available in the environment).
     # We use a broad exception catch here deliberately: in real research
     # environments, partial or mis-matched installs are common, and we want
     # a clean fallback rather than import-time crashes.
+    if not _should_probe_cc():
+        raise ImportError("cc-framework backend disabled or not installed")
     from cc.core.api import (  # type: ignore[import-untyped]
         RunBundle as _CCRBundle,
         Verdict as _CCVerdict,
@@ -47,9 +99,9 @@ try:  # pragma: no cover - exercised indirectly via tests / real environments
 except Exception:  # pragma: no cover - default code path in tests
     # Local fallback backend: everything is implemented in this repo.
     from .validators import RunBundle, Verdict
-    from .recommend import make_checklist, make_next_tests, make_recommendation
+    from .recommend import build_verdict
 
-    def compute_verdict(bundle: RunBundle) -> Verdict:
+    def _verdict_from_bundle(bundle: RunBundle) -> Verdict:
         """
         Fallback verdict computation using local CC logic.
 
@@ -67,16 +119,41 @@ except Exception:  # pragma: no cover - default code path in tests
         # `classify_cc` returns a string; cast to the Literal type for mypy.
         label = cast(Label, classify_cc(CC))
 
-        recommendation = make_recommendation(bundle, CC, label)
-        next_tests = make_next_tests(bundle, CC, label)
-        checklist = make_checklist(bundle)
+        return build_verdict(bundle, CC, label)
+
+    # Sized for parameter sweeps: a few thousand distinct bundles per session.
+    @lru_cache(maxsize=4096)
+    def _verdict_for_fingerprint(key: Tuple[Any, ...]) -> Verdict:
+        theta, patterns, rule, baselines, J_composed, objective = key
+        # The key came from an already-validated bundle; skip re-validation.
+        bundle = RunBundle.trusted(
+            theta=theta,
+            patterns=list(patterns),
+            rule=rule,
+            J_baselines=dict(baselines),
+            J_composed=J_composed,
+            objective=objective,
+        )
+        return _verdict_from_bundle(bundle)
 
-        return Verdict(
-            CC=CC,
-            label=label,
-            recommendation=recommendation,
-            next_tests=next_tests,
-            checklist=checklist,
+    def compute_verdict(bundle: RunBundle) -> Verdict:
+        """
+        Compute (or reuse) the fallback verdict for `bundle`.
+
+        The verdict is a pure function of the bundle's fields, so results are
+        memoised on `RunBundle.fingerprint()`; repeated bundles (CLI loops, UI
+        re-clicks, sweeps) skip the CC + recommendation work. Each call returns
+        its own copy: the model is frozen but its lists are not, so handing out
+        the cached instance would let one caller's edits leak into the next.
+        """
+        cached = _verdict_for_fingerprint(bundle.fingerprint())
+        # The remaining fields are immutable str/float, so fresh lists make
+        # this as independent as a deep copy at a third of the cost.
+        return cached.model_copy(
+            update={
+                "next_tests": list(cached.next_tests),
+                "checklist": list(cached.checklist),
+            }
         )
 
 else:  # pragma: no cover - path taken when cc-framework is installed
@@ -102,39 +179,132 @@ else:  # pragma: no cover - path taken when cc-framework is installed
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+# Objective → reducer that picks the best singleton, resolved once at import.
+_SELECTORS: Dict[str, Callable[..., float]] = {"minimize": min, "maximize": max}
 
-def _model_dump(obj: Any) -> Dict[str, Any]:
+
+def _resolve_objective(raw: Any) -> Objective:
+    """
+    Normalise an objective the same way `RunBundle` does and fail fast on typos.
+
+    Raises
+    ------
+    ValueError
+        If the objective is not "minimize" or "maximize" (case-insensitive).
+    """
+    objective = str(raw).strip().lower()
+    if objective not in _SELECTORS:
+        raise ValueError(f"objective must be 'minimize' or 'maximize', got {raw!r}")
+    return cast(Objective, objective)
+
+
+def _dump_model(obj: Any) -> Dict[str, Any]:
+    return obj.model_dump()  # type: ignore[no-any-return]
+
+
+def _dump_model_fields(obj: Any) -> Dict[str, Any]:
+    # Pydantic keeps declared field values in `__dict__`; reading it directly
+    # skips model_dump's filtering and recursion. Callers must not mutate it.
+    return obj.__dict__  # type: ignore[no-any-return]
+
+
+def _dump_public_attrs(obj: Any) -> Dict[str, Any]:
+    try:
+        attrs = obj.__dict__
+    except AttributeError:
+        raise TypeError(f"Cannot serialise object of type {type(obj)!r}") from None
+    return {k: v for k, v in attrs.items() if not k.startswith("_")}
+
+
+def _slots_dumper(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    # Public slot names across the MRO, read directly instead of via __dict__
+    # (slotted instances have none). Unset slots are skipped.
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if not name.startswith("_") and name not in names:
+                names.append(name)
+
+    def dump(obj: Any) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for name in names:
+            try:
+                out[name] = getattr(obj, name)
+            except AttributeError:
+                continue
+        return out
+
+    return dump
+
+
+# Converters resolved by `_dumper_for`, keyed on the exact type (one table
+# per `shallow` mode). Unbounded: the set of types that reach `_model_dump`
+# is small and fixed by the calling code.
+_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_SHALLOW_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _dumper_for(cls: type, shallow: bool = False) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Resolve (once per type) the converter `_model_dump` should use for `cls`.
+    """
+    table = _SHALLOW_DUMPERS if shallow else _DUMPERS
+    dumper = table.get(cls)
+    if dumper is None:
+        dumper = table.setdefault(cls, _resolve_dumper(cls, shallow))
+    return dumper
+
+
+def _resolve_dumper(cls: type, shallow: bool) -> Callable[[Any], Dict[str, Any]]:
+    """Probe `cls` for the converter `_dumper_for` stores."""
+    # Pydantic v2-style models
+    if hasattr(cls, "model_dump"):
+        return _dump_model_fields if shallow else _dump_model
+
+    # Generic mapping (checked before dataclasses: far more common here)
+    if issubclass(cls, Mapping):
+        return dict
+
+    # Dataclasses
+    if is_dataclass(cls):
+        return asdict
+
+    # Slotted objects without an instance __dict__
+    if cls.__dictoffset__ == 0 and hasattr(cls, "__slots__"):
+        return _slots_dumper(cls)
+
+    # Generic Python object
+    return _dump_public_attrs
+
+
+def _model_dump(obj: Any, *, shallow: bool = False) -> Dict[str, Any]:
     """
     Normalise various object types into a plain `dict`.
 
     Supported inputs (in order of preference)
     -----------------------------------------
     1. Pydantic v2 models with `.model_dump()`.
-    2. Dataclasses (converted via `dataclasses.asdict`).
-    3. Mapping instances (converted via `dict(...)`).
-    4. Objects with a `__dict__` attribute (excluding private attributes).
+    2. Mapping instances (converted via `dict(...)`).
+    3. Dataclasses (converted via `dataclasses.asdict`).
+    4. Objects with a `__dict__` attribute, or `__slots__` for slotted
+       classes (excluding private attributes in both cases).
 
     This intentionally matches how both the fallback `RunBundle` / `Verdict`
     and the cc-framework equivalents expose their data, without tying the API
     to a specific implementation (Pydantic vs dataclass vs hand-rolled).
-    """
-    # Pydantic v2-style models
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump()  # type: ignore[no-any-return]
-
-    # Dataclasses
-    if is_dataclass(obj):
-        return asdict(obj)
 
-    # Generic mapping
-    if isinstance(obj, Mapping):
+    The probe order above is resolved once per type by `_dumper_for`, so
+    repeated calls cost a single dict lookup. With ``shallow=True``,
+    Pydantic models return their field ``__dict__`` as a read-only view
+    instead of a recursive copy; use it only when the caller just reads
+    top-level values.
+    """
+    cls = type(obj)
+    if cls is dict:
+        # Plain dicts are the most common non-model input; skip the cache lookup.
         return dict(obj)
-
-    # Generic Python object
-    if hasattr(obj, "__dict__"):
-        return {k: v for k, v in obj.__dict__.items() if not k.startswith("_")}
-
-    raise TypeError(f"Cannot serialise object of type {type(obj)!r}")
+    return _dumper_for(cls, shallow)(obj)
 
 
 # ---------------------------------------------------------------------------
@@ -191,6 +361,8 @@ def fh_bounds(theta: float, epsilon: float = 0.05) -> Tuple[float, float]:
     This helper is deliberately minimal: its purpose is to provide a simple,
     stable way for the UI and exporters to show “θ ± ε” style bands without
     dragging in the full CC-framework bounds machinery.
+
+    For a whole θ sweep, use `fh_bounds_vec`.
     """
     theta_f = float(theta)
     eps = abs(float(epsilon))
@@ -199,6 +371,63 @@ def fh_bounds(theta: float, epsilon: float = 0.05) -> Tuple[float, float]:
     return (lower, upper)
 
 
+def fh_bounds_vec(thetas: Sequence[float] | np.ndarray, epsilon: float = 0.05) -> np.ndarray:
+    """
+    Vectorised `fh_bounds` for θ sweeps.
+
+    Returns a float array of shape ``(N, 2)`` whose row ``i`` equals
+    ``fh_bounds(thetas[i], epsilon)``.
+    """
+    import numpy as np
+
+    theta_arr = np.asarray(thetas, dtype=float).ravel()
+    eps = abs(float(epsilon))
+    out = np.empty((theta_arr.shape[0], 2))
+    np.maximum(theta_arr - eps, 0.0, out=out[:, 0])
+    np.minimum(theta_arr + eps, 1.0, out=out[:, 1])
+    return out
+
+
+def _reduce_baselines(
+    J_baselines: Mapping[str, Any], objective: Objective
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Return ``(best_singleton, best_finite)`` for `analyze_composition`.
+
+    ``best_singleton`` is the plain min/max of the values (so a NaN may win,
+    depending on order, exactly as builtin `min` / `max` behave) and
+    ``best_finite`` is the best finite value that CC is computed from. Both
+    are ``None`` if the values cannot be converted to float.
+
+    Large mappings are first reduced with NumPy; a finite result there means
+    no NaN/inf was present, so it equals both answers. Otherwise the
+    order-sensitive Python path below decides.
+    """
+    n = len(J_baselines)
+    if n >= _VECTORIZE_MIN_BASELINES:
+        import numpy as np
+
+        try:
+            arr = np.fromiter(J_baselines.values(), dtype=np.float64, count=n)
+        except (TypeError, ValueError):  # pragma: no cover - defensive
+            return None, None
+        best = float(arr.max() if objective == "maximize" else arr.min())
+        if math.isfinite(best):
+            return best, best
+
+    # Values may be strings / numpy scalars; convert defensively.
+    try:
+        values = tuple(map(float, J_baselines.values()))
+    except (TypeError, ValueError):  # pragma: no cover - defensive
+        return None, None
+
+    best_singleton = _SELECTORS[objective](values)
+    if math.isfinite(best_singleton):
+        # A finite min/max is also the best *finite* baseline.
+        return best_singleton, best_singleton
+    return best_singleton, _best_finite_value(values, objective)
+
+
 def analyze_composition(bundle: RunBundle | Mapping[str, Any]) -> Dict[str, Any]:
     """
     Lightweight helper to compute CC + best singleton from a bundle-like payload.
@@ -224,7 +453,7 @@ def analyze_composition(bundle: RunBundle | Mapping[str, Any]) -> Dict[str, Any]
         A plain dictionary with keys:
 
         - ``"theta"``        : float
-        - ``"objective"``    : as taken from the bundle (or ``"minimize"``)
+        - ``"objective"``    : normalised from the bundle (or ``"minimize"``)
         - ``"best_singleton"``: best J across baselines according to objective,
                                 or ``None`` if no baselines are provided.
         - ``"CC"``           : composability coefficient computed by `compute_cc`.
@@ -234,9 +463,11 @@ def analyze_composition(bundle: RunBundle | Mapping[str, Any]) -> Dict[str, Any]
     - This helper **does not** perform any bootstrapping, bounds, or label
       classification; for that, use `compute_verdict`.
     - It deliberately tolerates partial / minimal bundles so it can be used
-      in exploratory notebooks and quick UI previews.
+      in exploratory notebooks and quick UI previews. An unrecognised
+      objective, however, raises ``ValueError`` rather than silently picking
+      a direction.
     """
-    payload = _model_dump(bundle)
+    payload = _model_dump(bundle, shallow=True)
 
     # J_baselines may be missing or None; normalise to a dict.
     J_baselines = payload.get("J_baselines", {}) or {}
@@ -253,22 +484,19 @@ def analyze_composition(bundle: RunBundle | Mapping[str, Any]) -> Dict[str, Any]
             f"Expected 'J_composed' to be numeric (got {J_composed_raw!r})."
         ) from exc
 
-    objective = payload.get("objective", "minimize")
+    objective = _resolve_objective(payload.get("objective", "minimize"))
 
     # Best singleton: min or max across baseline Js according to the user's
     # objective. If nothing is provided, we surface `None` instead of guessing.
-    best_singleton: float | None = None
-    if J_baselines:
-        # Values may be strings / numpy scalars; convert defensively.
-        try:
-            baseline_values = [float(v) for v in J_baselines.values()]
-        except (TypeError, ValueError):  # pragma: no cover - defensive
-            baseline_values = []
-        if baseline_values:
-            selector = min if objective == "minimize" else max
-            best_singleton = selector(baseline_values)
+    # The same reduction feeds CC below, so the mapping is walked only once.
+    best_singleton, best_finite = (
+        _reduce_baselines(J_baselines, objective) if J_baselines else (None, None)
+    )
 
-    CC = compute_cc(J_baselines, J_composed, objective)
+    if best_singleton is None:
+        CC = compute_cc(J_baselines, J_composed, objective)
+    else:
+        CC = _cc_from_best(best_finite, J_composed, objective)
 
     return {
         "theta": float(payload.get("theta", 0.0)),
@@ -278,6 +506,69 @@ def analyze_composition(bundle: RunBundle | Mapping[str, Any]) -> Dict[str, Any]
     }
 
 
+def analyze_composition_grid(
+    thetas: Sequence[float] | np.ndarray,
+    J_baselines_matrix: np.ndarray,
+    J_composed: Sequence[float] | np.ndarray | float,
+    objective: str = "minimize",
+) -> Dict[str, Any]:
+    """
+    Vectorised `analyze_composition` for parameter sweeps (e.g. θ grids).
+
+    Parameters
+    ----------
+    thetas : array-like, shape (N,)
+        Composition knob for each row of the sweep.
+    J_baselines_matrix : array-like, shape (N, k)
+        Singleton J values per row; column ``j`` is the same baseline across rows.
+    J_composed : array-like, shape (N,) or float
+        Composed J per row (a scalar is broadcast).
+    objective : {"minimize", "maximize"}, default "minimize"
+        Shared by every row.
+
+    Returns
+    -------
+    dict
+        Columnar (struct-of-arrays) result with the same keys as
+        `analyze_composition`:
+
+        - ``"theta"``         : float array, shape (N,)
+        - ``"objective"``     : the objective string
+        - ``"best_singleton"``: float array, min/max of each row according to
+                                the objective (NaN when ``k == 0``)
+        - ``"CC"``            : float array from `compute_cc_vec`
+
+    Notes
+    -----
+    Returning arrays instead of a list of per-row dicts lets pandas / plotting
+    code consume the sweep without materialising N Python objects.
+    """
+    import numpy as np
+
+    objective = _resolve_objective(objective)
+    theta_arr = np.asarray(thetas, dtype=float).ravel()
+    matrix = np.asarray(J_baselines_matrix, dtype=float)
+    if matrix.ndim != 2 or matrix.shape[0] != theta_arr.shape[0]:
+        raise ValueError(
+            "J_baselines_matrix must have shape (len(thetas), k); "
+            f"got {matrix.shape} for {theta_arr.shape[0]} thetas."
+        )
+
+    composed = np.asarray(J_composed, dtype=float)
+
+    if matrix.shape[1] == 0:
+        best_singleton = np.full(theta_arr.shape, np.nan)
+    else:
+        best_singleton = (matrix.min if objective == "minimize" else matrix.max)(axis=1)
+
+    return {
+        "theta": theta_arr,
+        "objective": objective,
+        "best_singleton": best_singleton,
+        "CC": compute_cc_vec(matrix, composed, objective),
+    }
+
+
 def format_verdict(verdict: Verdict | Mapping[str, Any]) -> str:
     """
     Human-friendly one-line summary of a verdict.
@@ -294,16 +585,31 @@ def format_verdict(verdict: Verdict | Mapping[str, Any]) -> str:
     - If `next_tests` is present and non-empty, up to two entries are shown
       as a short preview; otherwise "no follow-ups" is printed.
     """
-    payload = _model_dump(verdict)
+    if isinstance(verdict, Verdict):
+        # Common case (straight from `compute_verdict`): the fields were
+        # validated on construction, so read them directly rather than
+        # normalising through `_model_dump` and string-keyed lookups.
+        tests = verdict.next_tests
+        tests_preview = ", ".join(map(str, tests[:2])) if tests else "no follow-ups"
+        return (
+            f"{verdict.label} (CC={float(verdict.CC):.2f}): "
+            f"{verdict.recommendation or ''} Next: {tests_preview}."
+        )
+
+    payload = _model_dump(verdict, shallow=True)
 
-    # CC value: robust to missing / non-numeric inputs.
+    # CC value: robust to missing / non-numeric inputs. Plain numbers skip
+    # the conversion; strings, NumPy scalars etc. still go through float().
     cc_raw = payload.get("CC")
-    try:
-        if cc_raw is None:
-            raise TypeError("CC missing")
+    if cc_raw is None:
+        cc_val = math.nan
+    elif isinstance(cc_raw, (int, float)):
         cc_val = float(cc_raw)
-    except (TypeError, ValueError):
-        cc_val = float("nan")
+    else:
+        try:
+            cc_val = float(cc_raw)
+        except (TypeError, ValueError):
+            cc_val = math.nan
 
     label = payload.get("label", "?")
 
@@ -312,20 +618,16 @@ def format_verdict(verdict: Verdict | Mapping[str, Any]) -> str:
     if not isinstance(rec, str):  # pragma: no cover - defensive
         rec = str(rec)
 
-    # Next tests: tolerate list of strings, list of dicts, etc.
+    # Next tests: tolerate list of strings, list of dicts, generators, etc.
+    # Only the two previewed items are consumed, however long the input is.
     next_tests_raw = payload.get("next_tests") or []
-    tests_preview: str
     try:
-        items = list(next_tests_raw)
+        preview = list(islice(next_tests_raw, 2))
     except TypeError:  # not iterable
-        items = []
+        preview = []
 
-    # Render a short preview string.
-    if not items:
-        tests_preview = "no follow-ups"
-    else:
-        # Convert arbitrary items to strings, but keep it short.
-        tests_preview = ", ".join(str(x) for x in items[:2])
+    # Render a short preview string, converting arbitrary items to strings.
+    tests_preview = ", ".join(map(str, preview)) if preview else "no follow-ups"
 
     return f"{label} (CC={cc_val:.2f}): {rec} Next: {tests_preview}."
 
@@ -362,3 +664,25 @@ def compute_verdict_from_params(**params: Any) -> Verdict:
     """
     bundle = RunBundle(**params)
     return compute_verdict(bundle)
+
+
+@cache
+def _bundle_list_adapter() -> Any:
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(List[RunBundle])
+
+
+def compute_verdicts_batch(params_list: Iterable[Mapping[str, Any]]) -> List[Verdict]:
+    """
+    Batch form of `compute_verdict_from_params` for sweeps and replicates.
+
+    All parameter mappings are validated in a single pydantic-core call
+    (noticeably cheaper than one `RunBundle(**params)` per item), then each
+    bundle goes through `compute_verdict`, so repeated bundles hit its cache.
+    Verdicts are returned in input order. As with the single-item helper,
+    validation errors propagate unchanged.
+    """
+    bundles = _bundle_list_adapter().validate_python(list(params_list))
+    return [compute_verdict(bundle) for bundle in bundles]
+
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import math
-from typing import Mapping, Optional, Literal
+from functools import cache
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Literal
+
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    import numpy as np
 
 # ---------------------------------------------------------------------------
 # Public types and constants
@@ -18,11 +22,19 @@ CCLabel = Literal["Constructive", "Independent", "Destructive"]
 #: CC values within ±INDEPENDENT_TOL of 1.0 are treated as "Independent".
 INDEPENDENT_TOL: float = 0.05  # ±5%
 
+#: Integer codes for `Objective`, as taken by the compiled CC kernel.
+_OBJECTIVE_CODES: Mapping[str, int] = {"minimize": 0, "maximize": 1}
+
+#: Baseline mappings at least this large are reduced with NumPy. Below it the
+#: per-call cost of building an array outweighs the Python loop it replaces.
+_VECTORIZE_MIN_BASELINES: int = 128
+
 __all__ = [
     "Objective",
     "CCLabel",
     "INDEPENDENT_TOL",
     "compute_cc",
+    "compute_cc_vec",
     "classify_cc",
 ]
 
@@ -32,6 +44,31 @@ __all__ = [
 # ---------------------------------------------------------------------------
 
 
+def _best_finite_value(values: Iterable[float], objective: Objective) -> Optional[float]:
+    """
+    Return the best finite value under the objective, or ``None`` if there is none.
+
+    Shared by `_best_singleton_value` and callers that have already pulled the
+    baseline values out of their mapping.
+
+    Single pass with no intermediate list. Comparisons are strict, so ties keep
+    the first value seen, as builtin `min` / `max` would.
+    """
+    isfinite = math.isfinite
+    best: Optional[float] = None
+    if objective == "maximize":
+        for value in values:
+            v = float(value)
+            if isfinite(v) and (best is None or v > best):
+                best = v
+    else:
+        for value in values:
+            v = float(value)
+            if isfinite(v) and (best is None or v < best):
+                best = v
+    return best
+
+
 def _best_singleton_value(
     J_baselines: Mapping[str, float],
     objective: Objective,
@@ -60,22 +97,29 @@ def _best_singleton_value(
     -----
     This function is deliberately conservative: if we cannot identify at least
     one finite baseline J, downstream logic treats CC as undefined (NaN).
+
+    Large mappings (``_VECTORIZE_MIN_BASELINES`` entries or more) are reduced
+    with a single NumPy min/max over the finite entries; smaller ones use the
+    plain Python loop, which is faster at typical sizes of two or three.
     """
-    if not J_baselines:
+    n = len(J_baselines)
+    if n == 0:
         return None
-
-    finite_vals = []
-    for value in J_baselines.values():
+    if n == 1:
+        # A single baseline is its own best; skip the reduction loop.
+        (value,) = J_baselines.values()
         v = float(value)
-        if math.isfinite(v):
-            finite_vals.append(v)
+        return v if math.isfinite(v) else None
+    if n < _VECTORIZE_MIN_BASELINES:
+        return _best_finite_value(J_baselines.values(), objective)
 
-    if not finite_vals:
-        return None
+    import numpy as np
 
-    if objective == "maximize":
-        return max(finite_vals)
-    return min(finite_vals)
+    arr = np.fromiter(J_baselines.values(), dtype=np.float64, count=n)
+    finite = arr[np.isfinite(arr)]
+    if finite.size == 0:
+        return None
+    return float(finite.max() if objective == "maximize" else finite.min())
 
 
 # ---------------------------------------------------------------------------
@@ -144,7 +188,25 @@ def compute_cc(
         depending on edge cases. Non-finite outputs are handled gracefully by
         :func:`classify_cc`.
     """
-    J_best = _best_singleton_value(J_baselines, objective)
+    n = len(J_baselines)
+    if n >= _VECTORIZE_MIN_BASELINES:
+        kernel = _jit_cc_kernel()
+        if kernel is not None:
+            import numpy as np
+
+            vals = np.fromiter(J_baselines.values(), dtype=np.float64, count=n)
+            return kernel(vals, float(J_comp), _OBJECTIVE_CODES[objective])
+
+    return _cc_from_best(_best_singleton_value(J_baselines, objective), J_comp, objective)
+
+
+def _cc_from_best(J_best: Optional[float], J_comp: float, objective: Objective) -> float:
+    """
+    Core of `compute_cc` once the best singleton value is known.
+
+    Exposed separately so callers that already reduced the baselines (e.g.
+    `analyze_composition`) do not walk the mapping a second time.
+    """
     J_c = float(J_comp)
 
     # No usable baseline: CC is undefined numerically.
@@ -177,10 +239,118 @@ def compute_cc(
     return J_best / J_c
 
 
+def _cc_kernel(vals: np.ndarray, j_comp: float, objective_code: int) -> float:
+    """
+    Single-pass `compute_cc` over a float64 array of baseline values.
+
+    ``objective_code`` comes from `_OBJECTIVE_CODES`. Written in the
+    subset of Python that Numba compiles; `_jit_cc_kernel` returns the compiled
+    version when Numba is installed.
+    """
+    maximize = objective_code == 1
+    best = -math.inf if maximize else math.inf
+    seen = False
+    for i in range(vals.shape[0]):
+        v = vals[i]
+        if math.isfinite(v):
+            seen = True
+            if (v > best) if maximize else (v < best):
+                best = v
+
+    if not seen:
+        return math.nan
+    if not maximize:
+        if best == 0.0:
+            return 1.0 if j_comp == 0.0 else math.inf
+        return j_comp / best
+    if j_comp <= 0.0:
+        return 1.0 if best <= 0.0 else math.inf
+    return best / j_comp
+
+
+@cache
+def _jit_cc_kernel() -> Optional[Callable[[np.ndarray, float, int], float]]:
+    """
+    Return `_cc_kernel` compiled with Numba, or ``None`` if Numba is unavailable.
+
+    Resolved on first use so importing this module never pays for Numba. The
+    explicit signature compiles eagerly here rather than on the first call.
+    """
+    try:
+        from numba import float64, int64, njit
+    except ImportError:
+        return None
+    return njit(float64(float64[:], float64, int64), cache=True)(_cc_kernel)
+
+
+def compute_cc_vec(
+    J_baselines_matrix: np.ndarray,
+    J_comp: np.ndarray | float,
+    objective: Objective,
+) -> np.ndarray:
+    """
+    Vectorised `compute_cc` over many bundles at once.
+
+    Parameters
+    ----------
+    J_baselines_matrix:
+        Array of shape ``(N, k)``: row ``i`` holds the ``k`` singleton J values
+        of bundle ``i``. Non-finite entries are ignored, exactly as in
+        `compute_cc`; a row with no finite entry yields ``NaN``.
+    J_comp:
+        Composed J values, shape ``(N,)`` or a scalar broadcast to every row.
+    objective:
+        ``\"minimize\"`` or ``\"maximize\"``, applied to every row.
+
+    Returns
+    -------
+    numpy.ndarray
+        Float array of shape ``(N,)`` whose entries equal
+        ``compute_cc(row, J_comp[i], objective)``, including the zero /
+        non-positive edge cases documented there.
+    """
+    import numpy as np
+
+    mat = np.asarray(J_baselines_matrix, dtype=float)
+    if mat.ndim != 2:
+        raise ValueError(
+            f"J_baselines_matrix must be 2-D (N, k); got shape {mat.shape}."
+        )
+    comp = np.broadcast_to(np.asarray(J_comp, dtype=float), (mat.shape[0],))
+
+    # Best finite singleton per row (non-finite entries masked out).
+    finite = np.isfinite(mat)
+    has_best = finite.any(axis=1)
+    if objective == "maximize":
+        best = np.where(finite, mat, -np.inf).max(axis=1, initial=-np.inf)
+    else:
+        best = np.where(finite, mat, np.inf).min(axis=1, initial=np.inf)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if objective == "minimize":
+            cc = np.where(
+                best == 0.0,
+                np.where(comp == 0.0, 1.0, np.inf),
+                comp / best,
+            )
+        else:
+            cc = np.where(
+                comp <= 0.0,
+                np.where(best <= 0.0, 1.0, np.inf),
+                best / comp,
+            )
+
+    return np.where(has_best, cc, np.nan)
+
+
 # ---------------------------------------------------------------------------
 # CC classification
 # ---------------------------------------------------------------------------
 
+#: Neutral band for the default tolerance, resolved once at import.
+_DEFAULT_LO: float = 1.0 - INDEPENDENT_TOL
+_DEFAULT_HI: float = 1.0 + INDEPENDENT_TOL
+
 
 def classify_cc(cc: float, tol: float = INDEPENDENT_TOL) -> CCLabel:
     """
@@ -220,8 +390,13 @@ def classify_cc(cc: float, tol: float = INDEPENDENT_TOL) -> CCLabel:
     if not math.isfinite(cc):
         return "Independent"
 
-    if cc < 1.0 - tol:
+    if tol == INDEPENDENT_TOL:
+        lo, hi = _DEFAULT_LO, _DEFAULT_HI
+    else:
+        lo, hi = 1.0 - tol, 1.0 + tol
+
+    if cc < lo:
         return "Constructive"
-    if cc > 1.0 + tol:
+    if cc > hi:
         return "Destructive"
     return "Independent"
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Mapping, MutableMapping, Sequence, Tuple, Union
+from functools import cache
+from typing import Callable, Iterable, List, Literal, Optional, Tuple
 
 import numpy as np
+from numpy.typing import DTypeLike
 
-# Public numeric input type: scalars, Python sequences, or numpy arrays.
-ArrayLike = Union[float, Sequence[float], np.ndarray]
-# Public return type: either a scalar float or an ndarray, depending on input.
-ReturnType = Union[float, np.ndarray]
+# `youden_j` and its input helpers live in `.youden`; they are re-exported here
+# so the whole metrics stack is importable from one module.
+from .youden import ArrayLike, ReturnType, _to_float_array, youden_j
+
+#: Score arrays at least this large count decisions with the compiled merge
+#: kernel when Numba is installed.
+_NUMBA_MIN_SCORES: int = 10_000
+
+#: Absolute tolerance within which two J values count as tied.
+_J_TIE_ATOL: float = 1e-12
 
 __all__ = [
     "ArrayLike",
@@ -17,164 +25,11 @@ __all__ = [
     "YoudenCurve",
     "compute_youden_curve",
     "optimal_youden_threshold",
+    "optimal_youden_thresholds_batch",
     "compute_cc_max",
 ]
 
 
-# ---------------------------------------------------------------------------
-# Low-level helper: robust conversion to float arrays
-# ---------------------------------------------------------------------------
-
-
-def _to_float_array(x: ArrayLike, name: str) -> np.ndarray:
-    """
-    Convert input to a NumPy float array with a clear error message on failure.
-
-    Parameters
-    ----------
-    x:
-        Input value(s) to convert.
-    name:
-        Logical name of the argument (e.g. "tpr", "fpr", "scores_w0") for
-        error messages.
-
-    Returns
-    -------
-    numpy.ndarray
-        Array of dtype float64.
-
-    Raises
-    ------
-    TypeError
-        If the input cannot be converted to a float array.
-    """
-    try:
-        return np.asarray(x, dtype=float)
-    except (TypeError, ValueError) as exc:
-        raise TypeError(
-            f"{name} must be convertible to a float array of numbers; "
-            f"received object of type {type(x)!r}."
-        ) from exc
-
-
-# ---------------------------------------------------------------------------
-# Youden's J statistic (scalar / vector)
-# ---------------------------------------------------------------------------
-
-
-def youden_j(tpr: ArrayLike, fpr: ArrayLike) -> ReturnType:
-    r"""
-    Compute Youden's J statistic, :math:`J = \mathrm{TPR} - \mathrm{FPR}`.
-
-    This is the basic scalar/vector form of the Youden index used throughout
-    the GCE metrics stack. It supports broadcasting and mixed input types,
-    and enforces the mathematically valid range for *finite* values.
-
-    Design goals
-    ------------
-    - **Flexible inputs**:
-        - Accept Python scalars, lists/tuples, or numpy arrays (or mixtures).
-        - Use NumPy broadcasting so shapes like ``(n,)`` and ``(1,)`` work
-          naturally.
-    - **Ergonomic return types**:
-        - If *both* inputs are Python scalars ⇒ return a Python ``float``.
-        - Otherwise ⇒ return a ``numpy.ndarray`` with the broadcast shape.
-    - **Numerical sanity**:
-        - Finite values of :math:`J` are clipped into the interval ``[-1, 1]``.
-        - Non-finite values (``NaN``, ``+/-inf``) are preserved and *not*
-          silently clipped or sanitized.
-    - **Clear failure modes**:
-        - If shapes are not broadcastable, raise a ``ValueError`` describing
-          the mismatch.
-        - If inputs are not numeric, raise a ``TypeError`` describing which
-          argument failed.
-
-    Parameters
-    ----------
-    tpr : ArrayLike
-        True positive rate(s). Semantically in ``[0, 1]``, but this function
-        does **not** enforce that range; callers are responsible for upstream
-        validation.
-    fpr : ArrayLike
-        False positive rate(s). Semantically in ``[0, 1]``, likewise not
-        enforced here.
-
-    Returns
-    -------
-    float or numpy.ndarray
-        - ``float`` if **both** inputs were Python scalars.
-        - ``numpy.ndarray`` otherwise, with the broadcast shape of
-          ``tpr`` and ``fpr``.
-
-    Raises
-    ------
-    TypeError
-        If either of ``tpr`` or ``fpr`` cannot be converted to a numeric
-        float array.
-    ValueError
-        If ``tpr`` and ``fpr`` cannot be broadcast to a common shape.
-
-    Notes
-    -----
-    - For inputs that are already in the valid probability range
-      (``tpr, fpr ∈ [0, 1]``), the raw difference ``tpr - fpr`` is
-      automatically in ``[-1, 1]``, so clipping only protects against
-      numerical noise or upstream misuse.
-    - Non-finite values are preserved. For example, if
-      ``tpr - fpr == np.inf``, the result will be ``np.inf``, not ``1.0``.
-
-    Examples
-    --------
-    Scalar inputs:
-
-    >>> youden_j(0.9, 0.1)
-    0.8
-
-    Vector inputs:
-
-    >>> youden_j([0.8, 0.9], [0.2, 0.1])
-    array([0.6, 0.8])
-
-    Broadcasting:
-
-    >>> youden_j([0.8, 0.9], 0.2)
-    array([0.6, 0.7])
-
-    Handling NaNs and infs:
-
-    >>> import numpy as np
-    >>> youden_j(np.array([0.9, np.nan, np.inf]), np.array([0.1, 0.2, 0.3]))
-    array([0.8,  nan,  inf])
-    """
-    # Convert inputs to float arrays with consistent dtype and good error messages.
-    t = _to_float_array(tpr, "tpr")
-    f = _to_float_array(fpr, "fpr")
-
-    # Attempt broadcasting explicitly so we can provide a clear error message.
-    try:
-        t_b, f_b = np.broadcast_arrays(t, f)
-    except ValueError as exc:
-        raise ValueError(
-            f"tpr and fpr shapes are not broadcastable: {t.shape} vs {f.shape}"
-        ) from exc
-
-    # Core definition: raw J = TPR − FPR.
-    raw = t_b - f_b
-
-    # For *finite* values, clip to [-1, 1].
-    # For NaN / +/-inf, preserve the original value.
-    finite_mask = np.isfinite(raw)
-    clipped = np.clip(raw, -1.0, 1.0)
-    j = np.where(finite_mask, clipped, raw)
-
-    # If the user gave two Python scalars, return a plain float for ergonomics.
-    # Note: j is a 0-d array in this case; float(j) extracts the scalar.
-    if np.isscalar(tpr) and np.isscalar(fpr) and j.shape == ():
-        return float(j)
-
-    return j
-
-
 # ---------------------------------------------------------------------------
 # Threshold scanning: Youden curve from W0 / W1 scores
 # ---------------------------------------------------------------------------
@@ -202,18 +57,48 @@ class YoudenCurve:
     fpr: np.ndarray
     j: np.ndarray
 
+    def to_records(self) -> np.ndarray:
+        """
+        The curve as one structured array with fields
+        ``threshold``, ``tpr``, ``fpr`` and ``j`` (one row per threshold).
+
+        The attributes above stay separate contiguous arrays, which is what
+        column-wise work (argmax over J, plotting a column) wants; this packed
+        copy suits row-wise consumers such as filtering rows or CSV export.
+        """
+        records = np.empty(
+            self.thresholds.shape[0],
+            dtype=[
+                ("threshold", self.thresholds.dtype),
+                ("tpr", self.tpr.dtype),
+                ("fpr", self.fpr.dtype),
+                ("j", self.j.dtype),
+            ],
+        )
+        records["threshold"] = self.thresholds
+        records["tpr"] = self.tpr
+        records["fpr"] = self.fpr
+        records["j"] = self.j
+        return records
 
-def _validate_scores(scores_w0: ArrayLike, scores_w1: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+
+def _validate_scores(
+    scores_w0: ArrayLike, scores_w1: ArrayLike, dtype: DTypeLike = np.float64
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Internal helper to coerce and validate W0/W1 score arrays.
+    Internal helper to coerce, validate and sort W0/W1 score arrays.
 
-    - Converts to 1-D float arrays.
+    - Converts to 1-D float arrays of ``dtype``, returned sorted ascending.
     - Requires at least one sample in each world.
     - Requires all scores to be finite (no NaNs or infs); those would make the
       ROC / J computations ill-defined and should be handled upstream.
+
+    The finiteness check piggybacks on the sort the caller needs anyway: NaN
+    sorts last and -inf first, so only the two ends have to be inspected
+    instead of scanning each array once more.
     """
-    s0 = _to_float_array(scores_w0, "scores_w0").ravel()
-    s1 = _to_float_array(scores_w1, "scores_w1").ravel()
+    s0 = np.sort(_to_float_array(scores_w0, "scores_w0", dtype), axis=None)
+    s1 = np.sort(_to_float_array(scores_w1, "scores_w1", dtype), axis=None)
 
     if s0.size == 0 or s1.size == 0:
         raise ValueError(
@@ -221,20 +106,104 @@ def _validate_scores(scores_w0: ArrayLike, scores_w1: ArrayLike) -> Tuple[np.nda
             f"got shapes {s0.shape} and {s1.shape}."
         )
 
-    if not np.all(np.isfinite(s0)):
+    if not (np.isfinite(s0[0]) and np.isfinite(s0[-1])):
         raise ValueError("scores_w0 contains non-finite values; please clean or filter upstream.")
-    if not np.all(np.isfinite(s1)):
+    if not (np.isfinite(s1[0]) and np.isfinite(s1[-1])):
         raise ValueError("scores_w1 contains non-finite values; please clean or filter upstream.")
 
     return s0, s1
 
 
+def _sorted_unique_union(s0: np.ndarray, s1: np.ndarray) -> np.ndarray:
+    """
+    ``np.unique(np.concatenate([s0, s1]))`` with one buffer sorted in place.
+
+    `np.unique` would sort a copy of the concatenation; filling a single
+    buffer and sorting it in place saves that extra full-size copy.
+    """
+    buf = np.empty(s0.size + s1.size, dtype=s0.dtype)
+    buf[: s0.size] = s0
+    buf[s0.size :] = s1
+    buf.sort()
+
+    keep = np.empty(buf.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(buf[1:], buf[:-1], out=keep[1:])
+    return buf[keep]
+
+
+def _merge_counts(sorted_scores: np.ndarray, thresholds: np.ndarray, side_right: bool) -> np.ndarray:
+    """
+    ``np.searchsorted(sorted_scores, thresholds, side)`` for ascending thresholds.
+
+    A single two-pointer merge, O(N + T). Written in the subset of Python that
+    Numba compiles; `_jit_merge_counts` returns the compiled version.
+    """
+    counts = np.empty(thresholds.shape[0], dtype=np.int64)
+    n = sorted_scores.shape[0]
+    i = 0
+    for k in range(thresholds.shape[0]):
+        t = thresholds[k]
+        if side_right:
+            while i < n and sorted_scores[i] <= t:
+                i += 1
+        else:
+            while i < n and sorted_scores[i] < t:
+                i += 1
+        counts[k] = i
+    return counts
+
+
+@cache
+def _jit_merge_counts() -> Optional[Callable[[np.ndarray, np.ndarray, bool], np.ndarray]]:
+    """
+    Return `_merge_counts` compiled with Numba, or ``None`` if it is unavailable.
+    """
+    try:
+        from numba import boolean, float64, int64, njit
+    except ImportError:
+        return None
+    return njit(int64[:](float64[:], float64[:], boolean), cache=True)(_merge_counts)
+
+
+def _roc_corner_indices(tpr: np.ndarray, fpr: np.ndarray) -> np.ndarray:
+    """
+    Indices of the ROC points worth keeping when dropping dominated thresholds.
+
+    Consecutive thresholds with identical (TPR, FPR) are collapsed to the
+    first (smallest) one; then points strictly inside a horizontal or vertical
+    run are dropped. Such a point always has a neighbour with strictly larger
+    J, so the argmax of J -- including its smallest-threshold tie-break -- is
+    unchanged.
+    """
+    n = tpr.size
+    if n <= 2:
+        return np.arange(n)
+
+    changed = np.empty(n, dtype=bool)
+    changed[0] = True
+    np.logical_or(np.diff(tpr) != 0, np.diff(fpr) != 0, out=changed[1:])
+    idx = np.flatnonzero(changed)
+    if idx.size <= 2:
+        return idx
+
+    t, f = tpr[idx], fpr[idx]
+    keep = np.ones(idx.size, dtype=bool)
+    keep[1:-1] = ~(
+        ((t[:-2] == t[1:-1]) & (t[1:-1] == t[2:]))
+        | ((f[:-2] == f[1:-1]) & (f[1:-1] == f[2:]))
+    )
+    return idx[keep]
+
+
 def compute_youden_curve(
     scores_w0: ArrayLike,
     scores_w1: ArrayLike,
     *,
     thresholds: ArrayLike | None = None,
     higher_scores_leakier: bool = True,
+    drop_dominated: bool = False,
+    dtype: DTypeLike = np.float64,
 ) -> YoudenCurve:
     """
     Compute TPR, FPR, and J across a grid of thresholds from W0/W1 scores.
@@ -254,6 +223,16 @@ def compute_youden_curve(
         If False, use ``decide_leak = (score <= threshold)`` instead. This
         lets you adapt to models where *lower* scores correspond to more
         suspicious / leaky behavior.
+    drop_dominated : bool, default False
+        If True, keep only the "corner" points of the ROC curve: repeated
+        (TPR, FPR) pairs and points in the middle of a run where only one of
+        TPR / FPR changes are dropped. The maximum of J and the threshold
+        `optimal_youden_threshold` picks are unaffected, and the output is
+        usually far shorter for well-separated scores.
+    dtype : numpy dtype, default float64
+        Float dtype used for scores, thresholds and the returned arrays.
+        ``np.float32`` halves the memory of large scans; scores that differ
+        only beyond float32 precision then share a threshold.
 
     Returns
     -------
@@ -270,36 +249,56 @@ def compute_youden_curve(
     - This function makes no claim about *optimality*; it just evaluates
       Youden's J on a grid of thresholds. See ``optimal_youden_threshold``
       for a convenience wrapper that finds the best threshold.
-    - Using the full unique score set as thresholds is reasonable for many
-      experiments, but for very large logs you may wish to downsample or
-      provide a custom threshold grid for performance.
+    - Decisions are counted with a binary search over the sorted scores, so
+      the full unique score set is affordable as a threshold grid even for
+      large logs (O(N log N) time, O(N) memory).
     """
-    s0, s1 = _validate_scores(scores_w0, scores_w1)
+    # Both arrays come back sorted ascending.
+    s0, s1 = _validate_scores(scores_w0, scores_w1, dtype)
 
     if thresholds is None:
-        thresholds_arr = np.unique(np.concatenate([s0, s1]))
+        thresholds_arr = _sorted_unique_union(s0, s1)
     else:
-        thresholds_arr = _to_float_array(thresholds, "thresholds").ravel()
+        thresholds_arr = _to_float_array(thresholds, "thresholds", dtype).ravel()
         thresholds_arr = np.unique(thresholds_arr)
 
     if thresholds_arr.size == 0:
         raise ValueError("No thresholds to evaluate: 'thresholds' resolved to an empty array.")
 
-    # Shape: (n_thresholds, n_samples)
-    thr = thresholds_arr[:, None]
+    # Count decisions per threshold by binary search over the sorted scores
+    # instead of materialising an (n_thresholds, n_samples) boolean matrix:
+    # O((T + N) log N) time and O(T + N) memory.
+    # Thresholds are ascending (np.unique), so with Numba available large
+    # inputs use a linear merge instead of one binary search per threshold.
+    kernel = (
+        _jit_merge_counts()
+        if s0.size + s1.size >= _NUMBA_MIN_SCORES and s0.dtype == np.float64
+        else None
+    )
+    side: Literal["left", "right"] = "left" if higher_scores_leakier else "right"
+    if kernel is not None:
+        below_w0 = kernel(s0, thresholds_arr, not higher_scores_leakier)
+        below_w1 = kernel(s1, thresholds_arr, not higher_scores_leakier)
+    else:
+        below_w0 = np.searchsorted(s0, thresholds_arr, side=side)
+        below_w1 = np.searchsorted(s1, thresholds_arr, side=side)
 
     if higher_scores_leakier:
-        # Decide "leak" when score >= threshold
-        decisions_w0 = s0[None, :] >= thr
-        decisions_w1 = s1[None, :] >= thr
+        # Decide "leak" when score >= threshold: count scores not below it.
+        leaks_w0 = s0.size - below_w0
+        leaks_w1 = s1.size - below_w1
     else:
-        # Decide "leak" when score <= threshold
-        decisions_w0 = s0[None, :] <= thr
-        decisions_w1 = s1[None, :] <= thr
+        # Decide "leak" when score <= threshold: count scores not above it.
+        leaks_w0 = below_w0
+        leaks_w1 = below_w1
 
     # TPR = P(decide=1 | W1), FPR = P(decide=1 | W0)
-    tpr = decisions_w1.mean(axis=1)
-    fpr = decisions_w0.mean(axis=1)
+    tpr = np.divide(leaks_w1, s1.size, dtype=s1.dtype)
+    fpr = np.divide(leaks_w0, s0.size, dtype=s0.dtype)
+
+    if drop_dominated:
+        keep = _roc_corner_indices(tpr, fpr)
+        thresholds_arr, tpr, fpr = thresholds_arr[keep], tpr[keep], fpr[keep]
 
     j = youden_j(tpr, fpr)  # vectorised call; returns ndarray
 
@@ -317,6 +316,8 @@ def optimal_youden_threshold(
     *,
     thresholds: ArrayLike | None = None,
     higher_scores_leakier: bool = True,
+    drop_dominated: bool = False,
+    dtype: DTypeLike = np.float64,
 ) -> Tuple[float, float, YoudenCurve]:
     """
     Find the threshold that maximizes Youden's J, along with the full curve.
@@ -331,6 +332,11 @@ def optimal_youden_threshold(
         Threshold grid to scan. If None, the union of unique scores is used.
     higher_scores_leakier : bool, default True
         See ``compute_youden_curve``.
+    drop_dominated : bool, default False
+        See ``compute_youden_curve``. Does not change ``best_j`` or
+        ``best_threshold``, only the size of the returned curve.
+    dtype : numpy dtype, default float64
+        See ``compute_youden_curve``.
 
     Returns
     -------
@@ -338,7 +344,8 @@ def optimal_youden_threshold(
         Maximum Youden's J (clipped to [-1, 1]) over the threshold grid.
     best_threshold : float
         Threshold at which J is maximized. If multiple thresholds share the
-        same maximum J, the smallest such threshold is returned.
+        same maximum J (up to floating-point noise of 1e-12), the smallest
+        such threshold is returned.
     curve : YoudenCurve
         The full curve object (thresholds, TPR, FPR, J).
 
@@ -358,18 +365,76 @@ def optimal_youden_threshold(
         scores_w1,
         thresholds=thresholds,
         higher_scores_leakier=higher_scores_leakier,
+        drop_dominated=drop_dominated,
+        dtype=dtype,
     )
 
-    # np.nanargmax will raise if all entries are NaN; that would indicate a
-    # deeper data issue (e.g. J wasn't computed correctly). We let that error
-    # surface rather than silently guessing.
-    idx = int(np.nanargmax(curve.j))
+    # An all-NaN curve would indicate a deeper data issue (e.g. J wasn't
+    # computed correctly). Surface it rather than silently guessing.
+    if np.isnan(curve.j).all():
+        raise ValueError("All-NaN Youden curve; cannot pick an optimal threshold.")
+    top_j = np.nanmax(curve.j)
+
+    # J values are differences of count ratios, so mathematically equal maxima
+    # can differ in the last ulp. Take the first (smallest-threshold) entry
+    # within a tiny tolerance of the maximum so the tie-break is deterministic;
+    # reduced-precision curves widen the tolerance to a few ulps of their dtype.
+    atol = max(_J_TIE_ATOL, 4.0 * float(np.finfo(curve.j.dtype).eps))
+    idx = int(np.argmax(curve.j >= top_j - atol))
     best_j = float(curve.j[idx])
     best_threshold = float(curve.thresholds[idx])
 
     return best_j, best_threshold, curve
 
 
+def optimal_youden_thresholds_batch(
+    score_pairs: Iterable[Tuple[ArrayLike, ArrayLike]],
+    *,
+    higher_scores_leakier: bool = True,
+    drop_dominated: bool = False,
+    dtype: DTypeLike = np.float64,
+    max_workers: int = 1,
+) -> List[Tuple[float, float, YoudenCurve]]:
+    """
+    Run ``optimal_youden_threshold`` over many ``(scores_w0, scores_w1)`` pairs.
+
+    Parameters
+    ----------
+    score_pairs : iterable of (ArrayLike, ArrayLike)
+        One ``(scores_w0, scores_w1)`` pair per experiment; sizes may differ.
+    higher_scores_leakier, drop_dominated, dtype
+        Shared by every pair; see ``compute_youden_curve``.
+    max_workers : int, default 1
+        Number of threads. The per-pair work is dominated by NumPy sorts and
+        searches, which release the GIL, so values above 1 run large pairs in
+        parallel.
+
+    Returns
+    -------
+    list of (best_j, best_threshold, curve)
+        One result per pair, in input order. The first failing pair's error
+        propagates, as it would from a plain loop.
+    """
+    pairs = list(score_pairs)
+
+    def run(pair: Tuple[ArrayLike, ArrayLike]) -> Tuple[float, float, YoudenCurve]:
+        return optimal_youden_threshold(
+            pair[0],
+            pair[1],
+            higher_scores_leakier=higher_scores_leakier,
+            drop_dominated=drop_dominated,
+            dtype=dtype,
+        )
+
+    if max_workers <= 1 or len(pairs) <= 1:
+        return [run(pair) for pair in pairs]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+        return list(pool.map(run, pairs))
+
+
 # ---------------------------------------------------------------------------
 # Composability Coefficient (CC_max) with safe edge-case handling
 # ---------------------------------------------------------------------------
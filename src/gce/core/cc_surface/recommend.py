@@ -9,10 +9,11 @@ This module is intentionally:
 - Robust: degrades gracefully when baselines or patterns are missing.
 """
 
-from typing import Iterable, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
 from .composition import CCLabel
-from .validators import RunBundle
+from .validators import RunBundle, Verdict
 
 
 def _best_baseline(bundle: RunBundle) -> Tuple[str, float]:
@@ -22,27 +23,66 @@ def _best_baseline(bundle: RunBundle) -> Tuple[str, float]:
     If no baselines are present, we return ("<none>", NaN) and let the
     caller decide how to phrase recommendations.
     """
-    if not bundle.J_baselines:
+    baselines = bundle.J_baselines
+    if not baselines:
         return "<none>", float("nan")
 
-    items: Iterable[Tuple[str, float]] = bundle.J_baselines.items()
-    if bundle.objective == "maximize":
-        return max(items, key=lambda item: float(item[1]))
-    return min(items, key=lambda item: float(item[1]))
+    # Values are already floats (RunBundle validates them), so key on the
+    # dict's own lookup instead of a Python lambda that re-casts each one.
+    # Ties still resolve to the first key in insertion order.
+    pick = max if bundle.objective == "maximize" else min
+    name = pick(baselines, key=baselines.__getitem__)
+    return name, baselines[name]
+
+
+@dataclass(frozen=True)
+class _RecoContext:
+    """
+    Bundle-derived substrings shared by the recommendation builders.
+
+    Built once per verdict by `build_verdict` so the best-baseline scan,
+    pattern join and θ formatting are not repeated by each builder.
+    """
+
+    best_name: str
+    best_val: float
+    has_baselines: bool
+    pat_str: str
+    theta_str: str
+
+    @classmethod
+    def from_bundle(cls, bundle: RunBundle) -> _RecoContext:
+        best_name, best_val = _best_baseline(bundle)
+        return cls(
+            best_name=best_name,
+            best_val=best_val,
+            has_baselines=bool(bundle.J_baselines),
+            pat_str=", ".join(bundle.patterns),
+            theta_str=f"{bundle.theta:.2f}",
+        )
+
+
+_TONE: Dict[str, str] = {
+    "Constructive": "Lean into the synergy.",
+    "Independent": "Hold the line — the blend is neutral.",
+    "Destructive": "Dial back the composition until diagnostics improve.",
+}
 
 
 def _tone_for_label(label: CCLabel) -> str:
     """
     Short, leading phrase that sets the tone of the recommendation.
     """
-    return {
-        "Constructive": "Lean into the synergy.",
-        "Independent": "Hold the line — the blend is neutral.",
-        "Destructive": "Dial back the composition until diagnostics improve.",
-    }[label]
+    return _TONE[label]
 
 
-def make_recommendation(bundle: RunBundle, CC: float, label: CCLabel) -> str:
+def make_recommendation(
+    bundle: RunBundle,
+    CC: float,
+    label: CCLabel,
+    *,
+    ctx: Optional[_RecoContext] = None,
+) -> str:
     """
     Produce a single-sentence recommendation tying the numeric CC to the
     experiment context (rule, theta, baselines, patterns).
@@ -50,34 +90,43 @@ def make_recommendation(bundle: RunBundle, CC: float, label: CCLabel) -> str:
     The text is designed to be:
     - Interpretable in isolation.
     - Safe when baselines or patterns are missing.
+
+    ``ctx`` may carry a precomputed `_RecoContext` so callers that build
+    several texts for one bundle (see `build_verdict`) derive it only once.
     """
+    if ctx is None:
+        ctx = _RecoContext.from_bundle(bundle)
     tone = _tone_for_label(label)
-    has_baselines = bool(bundle.J_baselines)
-    best_name, best_val = _best_baseline(bundle)
 
-    if has_baselines:
+    if ctx.has_baselines:
         # Full comparison against best singleton.
         recommendation = (
-            f"{tone} Rule '{bundle.rule}' at θ={bundle.theta:.2f} delivers "
-            f"{bundle.J_composed:.3g} vs singleton '{best_name}'={best_val:.3g} "
+            f"{tone} Rule '{bundle.rule}' at θ={ctx.theta_str} delivers "
+            f"{bundle.J_composed:.3g} vs singleton '{ctx.best_name}'={ctx.best_val:.3g} "
             f"(CC={CC:.2f}, objective={bundle.objective})."
         )
     else:
         # No reference singleton: explain how to interpret CC.
         recommendation = (
-            f"{tone} Rule '{bundle.rule}' at θ={bundle.theta:.2f} delivers "
+            f"{tone} Rule '{bundle.rule}' at θ={ctx.theta_str} delivers "
             f"{bundle.J_composed:.3g} with no singleton baselines; "
             f"treat CC={CC:.2f} as relative to a neutral reference "
             f"(objective={bundle.objective})."
         )
 
     if bundle.patterns:
-        recommendation += f" Patterns in play: {', '.join(bundle.patterns)}."
+        recommendation += f" Patterns in play: {ctx.pat_str}."
 
     return recommendation
 
 
-def make_next_tests(bundle: RunBundle, CC: float, label: CCLabel) -> List[str]:
+def make_next_tests(
+    bundle: RunBundle,
+    CC: float,
+    label: CCLabel,
+    *,
+    ctx: Optional[_RecoContext] = None,
+) -> List[str]:
     """
     Generate concrete follow-up experiments tailored to the verdict.
 
@@ -97,15 +146,19 @@ def make_next_tests(bundle: RunBundle, CC: float, label: CCLabel) -> List[str]:
         - Try orthogonal pattern combos for stronger signal.
 
     When no baselines exist, tests pivot toward establishing a reference.
+    ``ctx`` is the same optional precomputed context as in `make_recommendation`.
     """
+    if ctx is None:
+        ctx = _RecoContext.from_bundle(bundle)
     tests: List[str] = []
-    has_baselines = bool(bundle.J_baselines)
-    best_name, best_val = _best_baseline(bundle)
-    pat_str = ", ".join(bundle.patterns)
+    has_baselines = ctx.has_baselines
+    best_name, best_val = ctx.best_name, ctx.best_val
+    pat_str = ctx.pat_str
+    theta_str = ctx.theta_str
 
     if label == "Constructive":
         tests.append(
-            f"Expand the θ sweep around {bundle.theta:.2f} for rule '{bundle.rule}' "
+            f"Expand the θ sweep around {theta_str} for rule '{bundle.rule}' "
             "to map the constructive window."
         )
 
@@ -140,7 +193,7 @@ def make_next_tests(bundle: RunBundle, CC: float, label: CCLabel) -> List[str]:
             )
 
         tests.append(
-            f"Probe lower θ values than {bundle.theta:.2f} to find a safer operating point."
+            f"Probe lower θ values than {theta_str} to find a safer operating point."
         )
         tests.append(
             "Audit the composed pipeline for unexpected interactions, data leakage, or misconfigured guards."
@@ -148,7 +201,7 @@ def make_next_tests(bundle: RunBundle, CC: float, label: CCLabel) -> List[str]:
 
     else:  # Independent
         tests.append(
-            f"Perform a finer θ sweep around {bundle.theta:.2f} to confirm neutral behavior."
+            f"Perform a finer θ sweep around {theta_str} to confirm neutral behavior."
         )
 
         if has_baselines:
@@ -168,11 +221,14 @@ def make_next_tests(bundle: RunBundle, CC: float, label: CCLabel) -> List[str]:
     return tests
 
 
-def make_checklist(bundle: RunBundle) -> List[str]:
+def make_checklist(bundle: RunBundle, *, ctx: Optional[_RecoContext] = None) -> List[str]:
     """
     Generate a short checklist of sanity / instrumentation items that should
     be true for the verdict to be trustworthy.
+
+    ``ctx`` is the same optional precomputed context as in `make_recommendation`.
     """
+    theta_str = ctx.theta_str if ctx is not None else f"{bundle.theta:.2f}"
     count = len(bundle.J_baselines)
     checklist: List[str] = [
         f"Confirm objective='{bundle.objective}' aligns with how J is interpreted.",
@@ -188,14 +244,32 @@ def make_checklist(bundle: RunBundle) -> List[str]:
         )
 
     checklist.append(
-        f"Document how θ={bundle.theta:.2f} for rule '{bundle.rule}' was chosen."
+        f"Document how θ={theta_str} for rule '{bundle.rule}' was chosen."
     )
 
     if bundle.patterns:
         checklist.append(
-            f"Ensure instrumentation exists for patterns: {', '.join(bundle.patterns)}."
+            f"Ensure instrumentation exists for patterns: "
+            f"{ctx.pat_str if ctx is not None else ', '.join(bundle.patterns)}."
         )
     else:
         checklist.append("Record why no pattern diagnostics were supplied.")
 
     return checklist
+
+
+def build_verdict(bundle: RunBundle, CC: float, label: CCLabel) -> Verdict:
+    """
+    Assemble a `Verdict` for an already-computed CC and label.
+
+    The shared `_RecoContext` is derived once and handed to all three text
+    builders.
+    """
+    ctx = _RecoContext.from_bundle(bundle)
+    return Verdict(
+        CC=CC,
+        label=label,
+        recommendation=make_recommendation(bundle, CC, label, ctx=ctx),
+        next_tests=make_next_tests(bundle, CC, label, ctx=ctx),
+        checklist=make_checklist(bundle, ctx=ctx),
+    )
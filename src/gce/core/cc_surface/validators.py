@@ -13,10 +13,16 @@ They are used in the fallback (no-cc-framework) backend and as schemas for
 CLI / JSON I/O.
 """
 
-from typing import Any, Dict, List, Mapping, cast
+from typing import Annotated, Any, Dict, List, Tuple, cast
 
-import math
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FiniteFloat,
+    StringConstraints,
+    field_validator,
+)
 
 from .composition import Objective, CCLabel
 
@@ -44,20 +50,25 @@ class RunBundle(BaseModel):
 
     model_config = ConfigDict(
         extra="ignore",  # tolerate extra fields from other tools / versions
-        frozen=False,
+        frozen=True,  # immutable after validation, so verdicts can be memoised
     )
 
-    theta: float = Field(..., description="Composition knob / scenario parameter")
+    # Finiteness, stripping and non-emptiness are enforced by pydantic-core's
+    # own constraints rather than Python field validators, which keeps
+    # per-bundle construction cost down.
+    theta: FiniteFloat = Field(..., description="Composition knob / scenario parameter")
     patterns: List[str] = Field(
         default_factory=list,
         description="Pattern identifiers participating in the composition",
     )
-    rule: str = Field(..., min_length=1, description="Composition rule label")
-    J_baselines: Dict[str, float] = Field(
+    rule: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)] = Field(
+        ..., description="Composition rule label"
+    )
+    J_baselines: Dict[str, FiniteFloat] = Field(
         ...,
         description="Singleton J values by name",
     )
-    J_composed: float = Field(
+    J_composed: FiniteFloat = Field(
         ...,
         description="Composed J value for the rule at this theta",
     )
@@ -70,15 +81,6 @@ class RunBundle(BaseModel):
     # Validators
     # ------------------------------------------------------------------
 
-    @field_validator("theta")
-    @classmethod
-    def _theta_ok(cls, v: float) -> float:
-        v = float(v)
-        if not math.isfinite(v):
-            raise ValueError("theta must be a finite float")
-        # We do NOT clamp to [0, 1]; callers may use other ranges.
-        return v
-
     @field_validator("patterns")
     @classmethod
     def _patterns_ok(cls, v: List[Any]) -> List[str]:
@@ -90,49 +92,7 @@ class RunBundle(BaseModel):
                 cleaned.append(s)
         return cleaned
 
-    @field_validator("rule")
-    @classmethod
-    def _rule_ok(cls, v: str) -> str:
-        v = str(v).strip()
-        if not v:
-            raise ValueError("rule must be a non-empty string")
-        return v
-
-    @field_validator("J_baselines")
-    @classmethod
-    def _j_map_ok(cls, v: Mapping[Any, Any]) -> Dict[str, float]:
-        """
-        Ensure all keys are strings and all values are finite floats.
-        An empty mapping is allowed (CC then defaults to neutral=1.0).
-        """
-        result: Dict[str, float] = {}
-        for k, val in v.items():
-            key = str(k)
-            try:
-                fv = float(val)
-            except (TypeError, ValueError) as exc:
-                raise ValueError(
-                    f"J_baselines[{key!r}] must be numeric, got {val!r}"
-                ) from exc
-            if not math.isfinite(fv):
-                raise ValueError(
-                    f"J_baselines[{key!r}] must be finite, got {fv!r}"
-                )
-            result[key] = fv
-        return result
-
-    @field_validator("J_composed")
-    @classmethod
-    def _j_ok(cls, v: Any) -> float:
-        try:
-            fv = float(v)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"J_composed must be numeric, got {v!r}") from exc
-        if not math.isfinite(fv):
-            raise ValueError(f"J_composed must be finite, got {fv!r}")
-        return fv
-
-    @field_validator("objective")
+    @field_validator("objective", mode="before")
     @classmethod
     def _objective_ok(cls, v: Any) -> Objective:
         """
@@ -151,6 +111,56 @@ class RunBundle(BaseModel):
             )
         return cast(Objective, norm)
 
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def trusted(cls, **fields: Any) -> RunBundle:
+        """
+        Build a bundle from fields that are already validated and normalised.
+
+        This is `model_construct`: no coercion, no finiteness checks. Use it
+        only for data that came out of another RunBundle (e.g. a fingerprint);
+        external dict/JSON input must go through `RunBundle(**payload)`.
+        """
+        return cls.model_construct(**fields)
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """
+        Hashable snapshot of every field, preserving baseline/pattern order.
+
+        Order matters downstream (ties between equal baselines resolve to the
+        first one), so this is the key to memoise on rather than `hash(self)`.
+        """
+        return (
+            self.theta,
+            tuple(self.patterns),
+            self.rule,
+            tuple(self.J_baselines.items()),
+            self.J_composed,
+            self.objective,
+        )
+
+    def __hash__(self) -> int:
+        # The model is frozen, but its list/dict fields are not hashable as-is.
+        # Baselines hash as a frozenset to stay consistent with `==`, which
+        # ignores dict ordering.
+        return hash(
+            (
+                self.theta,
+                tuple(self.patterns),
+                self.rule,
+                frozenset(self.J_baselines.items()),
+                self.J_composed,
+                self.objective,
+            )
+        )
+
 
 class Verdict(BaseModel):
     """
@@ -172,10 +182,10 @@ class Verdict(BaseModel):
 
     model_config = ConfigDict(
         extra="ignore",  # tolerate additional fields from upstream backends
-        frozen=False,
+        frozen=True,
     )
 
-    CC: float = Field(..., ge=0.0, description="Primary composability ratio (>= 0)")
+    CC: FiniteFloat = Field(..., ge=0.0, description="Primary composability ratio (>= 0)")
     label: CCLabel
     recommendation: str = Field(
         "",
@@ -190,17 +200,6 @@ class Verdict(BaseModel):
         description="Checklist of instrumentation / sanity checks",
     )
 
-    @field_validator("CC")
-    @classmethod
-    def _cc_ok(cls, v: Any) -> float:
-        try:
-            fv = float(v)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"CC must be numeric, got {v!r}") from exc
-        if fv < 0 or not math.isfinite(fv):
-            raise ValueError(f"CC must be a finite, non-negative float, got {fv!r}")
-        return fv
-
     @field_validator("next_tests", "checklist")
     @classmethod
     def _string_list(cls, v: List[Any]) -> List[str]:
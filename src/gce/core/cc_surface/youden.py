@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import math
 from typing import Sequence, Union
 
 import numpy as np
+from numpy.typing import DTypeLike
 
 # Public numeric input type: scalars, Python sequences, or numpy arrays.
 ArrayLike = Union[float, Sequence[float], np.ndarray]
@@ -11,8 +13,19 @@ ReturnType = Union[float, np.ndarray]
 
 __all__ = ["ArrayLike", "youden_j"]
 
+# Scalar types `youden_j` handles without building arrays (bool is an int).
+_REAL_SCALARS = (int, float, np.integer, np.floating)
 
-def _to_float_array(x: ArrayLike, name: str) -> np.ndarray:
+
+def _float_dtype_of(x: ArrayLike) -> DTypeLike:
+    # Float arrays keep their precision (e.g. float32); anything else is
+    # converted to float64.
+    if isinstance(x, np.ndarray) and x.dtype.kind == "f":
+        return x.dtype
+    return np.float64
+
+
+def _to_float_array(x: ArrayLike, name: str, dtype: DTypeLike = np.float64) -> np.ndarray:
     """
     Convert input to a NumPy float array with a clear error message on failure.
 
@@ -22,11 +35,13 @@ def _to_float_array(x: ArrayLike, name: str) -> np.ndarray:
         Input value(s) to convert.
     name:
         Logical name of the argument (e.g. "tpr", "fpr") for error messages.
+    dtype:
+        Target float dtype; float64 unless a caller opts into e.g. float32.
 
     Returns
     -------
     numpy.ndarray
-        Array of dtype float64.
+        Array of dtype ``dtype``.
 
     Raises
     ------
@@ -34,7 +49,7 @@ def _to_float_array(x: ArrayLike, name: str) -> np.ndarray:
         If the input cannot be converted to a float array.
     """
     try:
-        return np.asarray(x, dtype=float)
+        return np.asarray(x, dtype=dtype)
     except (TypeError, ValueError) as exc:
         raise TypeError(
             f"{name} must be convertible to a float array of numbers; "
@@ -85,6 +100,8 @@ def youden_j(tpr: ArrayLike, fpr: ArrayLike) -> ReturnType:
         - ``float`` if **both** inputs were Python scalars.
         - ``numpy.ndarray`` otherwise, with the broadcast shape of
           ``tpr`` and ``fpr``.
+        - Float array inputs keep their precision (float32 in -> float32
+          out); other inputs are computed in float64.
 
     Raises
     ------
@@ -126,26 +143,35 @@ def youden_j(tpr: ArrayLike, fpr: ArrayLike) -> ReturnType:
     >>> youden_j(np.array([0.9, np.nan, np.inf]), np.array([0.1, 0.2, 0.3]))
     array([0.8,  nan,  inf])
     """
+    # Two real scalars: plain float arithmetic, same clipping / non-finite rules.
+    if isinstance(tpr, _REAL_SCALARS) and isinstance(fpr, _REAL_SCALARS):
+        diff = float(tpr) - float(fpr)
+        if math.isfinite(diff):
+            return min(1.0, max(-1.0, diff))
+        return diff
+
     # Convert inputs to float arrays with consistent dtype and good error messages.
-    t = _to_float_array(tpr, "tpr")
-    f = _to_float_array(fpr, "fpr")
+    # Float arrays keep their own precision; the subtraction then promotes to
+    # the wider of the two dtypes.
+    t = _to_float_array(tpr, "tpr", _float_dtype_of(tpr))
+    f = _to_float_array(fpr, "fpr", _float_dtype_of(fpr))
 
-    # Attempt broadcasting explicitly so we can provide a clear error message.
+    # Core definition: raw J = TPR − FPR. The subtraction broadcasts by
+    # itself; only its failure is rewrapped to give a clear error message.
     try:
-        t_b, f_b = np.broadcast_arrays(t, f)
+        raw = np.subtract(t, f)
     except ValueError as exc:
         raise ValueError(
             f"tpr and fpr shapes are not broadcastable: {t.shape} vs {f.shape}"
         ) from exc
-
-    # Core definition: raw J = TPR − FPR.
-    raw = t_b - f_b
-
-    # For *finite* values, clip to [-1, 1].
-    # For NaN / +/-inf, preserve the original value.
-    finite_mask = np.isfinite(raw)
-    clipped = np.clip(raw, -1.0, 1.0)
-    j = np.where(finite_mask, clipped, raw)
+    # 0-d inputs yield a NumPy scalar; make it an array so it can be clipped.
+    j = np.asarray(raw)
+
+    # For *finite* values, clip to [-1, 1] in place; `where=` leaves NaN /
+    # +/-inf untouched. Rates in [0, 1] never need it, so skip the (costly)
+    # clip call unless something is actually out of range.
+    if ((j > 1.0) | (j < -1.0)).any():
+        np.clip(j, -1.0, 1.0, out=j, where=np.isfinite(j))
 
     # If the user gave two Python scalars, return a plain float for ergonomics.
     # Note: j is a 0-d array in this case; float(j) extracts the scalar.
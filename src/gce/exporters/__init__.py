@@ -7,6 +7,7 @@ from .one_pager import (
     render_text_report,
     verdict_to_json,
     verdict_to_pdf,
+    verdict_to_pdf_bytes,
 )
 
 __all__ = [
@@ -16,6 +17,7 @@ __all__ = [
     "render_text_report",
     "verdict_to_json",
     "verdict_to_pdf",
+    "verdict_to_pdf_bytes",
 ]
 
 
@@ -14,18 +14,37 @@ Design goals:
 - Be robust to missing / partial payloads.
 - Fail loudly on truly unsupported payload types.
 - Keep outputs stable enough for tests and course submissions.
+
+ReportLab's canvas and font-metrics modules take tens of milliseconds to
+import, so they are imported inside the PDF helpers; JSON and text exports
+never load them.
 """
 
-import json
+import io
+import os
 import tempfile
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, MutableMapping, Optional, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+)
 
 from reportlab.lib.pagesizes import letter  # type: ignore[import-untyped]
 from reportlab.lib.units import inch  # type: ignore[import-untyped]
-from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
+
+from .._json import dumps as _json_dumps
 from ..core.cc_surface.api import RunBundle, Verdict, compute_verdict
 
 
@@ -34,22 +53,47 @@ from ..core.cc_surface.api import RunBundle, Verdict, compute_verdict
 # ---------------------------------------------------------------------------
 
 
-def _normalize_mapping(payload: Any) -> Dict[str, Any]:
+# The two models every exporter sees, bound once to pydantic-core's serializer.
+# `to_python` is what `model_dump()` calls after argument handling, so the
+# result is identical but skips that per-call overhead (and the comparatively
+# slow `isinstance(..., Mapping)` ABC check below).
+_MODEL_DUMPERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    cls: cls.__pydantic_serializer__.to_python
+    for cls in (RunBundle, Verdict)
+    if hasattr(cls, "__pydantic_serializer__")
+}
+
+
+def _normalize_mapping(payload: Any, *, copy: bool = True) -> Dict[str, Any]:
     """
     Convert an arbitrary "payload-like" object into a plain dict.
 
     Supported inputs:
     - None        → {}
-    - Mapping     → dict(payload)
+    - Mapping     → dict(payload); a dict is returned as-is when `copy=False`
     - Pydantic v2 models (model_dump)
     - Generic objects with a `__dict__` (excluding private attrs)
 
     Anything else raises TypeError. This keeps JSON export honest instead of
     silently dropping complex objects.
+
+    Pass `copy=False` from read-only callers (text rendering, JSON encoding)
+    to skip the shallow copy of dict inputs; results that escape to the
+    caller, like `build_payload`'s, keep the default copy. Other mappings are
+    always converted, since the JSON encoders only accept real dicts.
     """
     if payload is None:
         return {}
+    cls = type(payload)
+    dumper = _MODEL_DUMPERS.get(cls)
+    if dumper is not None:
+        return dumper(payload)
+    if cls is dict:
+        # Exact-type check first: much cheaper than the Mapping ABC test.
+        return dict(payload) if copy else payload
     if isinstance(payload, Mapping):
+        if not copy and isinstance(payload, dict):
+            return payload
         # Make a shallow copy so callers can't mutate original objects via the payload.
         return dict(payload)
     if hasattr(payload, "model_dump"):
@@ -64,6 +108,22 @@ def _normalize_mapping(payload: Any) -> Dict[str, Any]:
     raise TypeError(f"Unsupported payload type for normalization: {type(payload)!r}")
 
 
+@lru_cache(maxsize=1)
+def _iso_at(second: int) -> str:
+    """ISO-8601 UTC timestamp for a whole epoch second (memoised)."""
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def _iso_now() -> str:
+    """
+    Current UTC time as an ISO-8601 string, at one-second resolution.
+
+    Exports generated within the same second reuse one formatted string,
+    which keeps batch report loops from re-formatting a datetime per call.
+    """
+    return _iso_at(int(time.time()))
+
+
 def _safe_float(value: Any, *, default: float = float("nan")):  # type: ignore[valid-type]
     """
     Best-effort conversion to float.
@@ -87,6 +147,7 @@ def build_payload(
     verdict: Verdict,
     *,
     metadata: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Build a JSON-serialisable payload from a RunBundle + Verdict.
@@ -98,15 +159,33 @@ def build_payload(
         "verdict": {...},           # normalised dict
         "metadata": {...}           # (optional)
     }
+
+    Pass `generated_at` to stamp a batch of exports with one shared value;
+    it defaults to the current second.
+    """
+    return _envelope(bundle, verdict, metadata, generated_at, copy=True)
+
+
+def _envelope(
+    bundle: RunBundle | Mapping[str, Any] | None,
+    verdict: Verdict,
+    metadata: Optional[Dict[str, Any]],
+    generated_at: Optional[str],
+    *,
+    copy: bool,
+) -> Dict[str, Any]:
+    """
+    `build_payload`'s body. With `copy=False`, dict inputs are referenced
+    rather than copied; only for callers that consume the envelope at once.
     """
     payload: Dict[str, Any] = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "bundle": _normalize_mapping(bundle) if bundle is not None else {},
-        "verdict": _normalize_mapping(verdict),
+        "generated_at": generated_at if generated_at is not None else _iso_now(),
+        "bundle": _normalize_mapping(bundle, copy=copy) if bundle is not None else {},
+        "verdict": _normalize_mapping(verdict, copy=copy),
     }
     if metadata:
         # Make a shallow copy to avoid callers mutating the payload after the fact.
-        payload["metadata"] = dict(metadata)
+        payload["metadata"] = dict(metadata) if copy else metadata
     return payload
 
 
@@ -115,12 +194,17 @@ def verdict_to_json(
     *,
     bundle: RunBundle | Mapping[str, Any] | None = None,
     metadata: Optional[Dict[str, Any]] = None,
+    generated_at: Optional[str] = None,
 ) -> str:
     """
     Serialize a Verdict with optional bundle + metadata to pretty-printed JSON.
+
+    Encoding goes through orjson when the `fast` extra is installed.
+    `generated_at` is as in `build_payload`. The envelope is encoded straight
+    away, so dict inputs are not copied first.
     """
-    envelope = build_payload(bundle, verdict, metadata=metadata)
-    return json.dumps(envelope, indent=2)
+    envelope = _envelope(bundle, verdict, metadata, generated_at, copy=False)
+    return _json_dumps(envelope, indent=True)
 
 
 # ---------------------------------------------------------------------------
@@ -128,6 +212,17 @@ def verdict_to_json(
 # ---------------------------------------------------------------------------
 
 
+def _append_numbered(
+    lines: list[str], header: str, items: Optional[Sequence[str]]
+) -> None:
+    """Append a header and its numbered items (or "(none)") to `lines` in place."""
+    lines.append(header)
+    if not items:
+        lines.append("(none)")
+        return
+    lines.extend([f"{idx}. {item}" for idx, item in enumerate(items, 1)])
+
+
 def render_text_report(
     bundle: RunBundle | Mapping[str, Any],
     verdict: Verdict,
@@ -143,16 +238,8 @@ def render_text_report(
     - Recommendation paragraph
     - Numbered "Next Tests" and "Checklist" sections
     """
-    bundle_payload = _normalize_mapping(bundle)
-    verdict_payload = _normalize_mapping(verdict)
-
-    def _list_section(header: str, items: Optional[Sequence[str]]) -> list[str]:
-        if not items:
-            return [header, "(none)"]
-        lines: list[str] = [header]
-        for idx, item in enumerate(items, 1):
-            lines.append(f"{idx}. {item}")
-        return lines
+    bundle_payload = _normalize_mapping(bundle, copy=False)
+    verdict_payload = _normalize_mapping(verdict, copy=False)
 
     cc_value = verdict_payload.get("CC")
     cc_display = _safe_float(cc_value)
@@ -179,11 +266,11 @@ def render_text_report(
     lines.append("")
 
     # Next Tests
-    lines.extend(_list_section("Next Tests", verdict_payload.get("next_tests")))
+    _append_numbered(lines, "Next Tests", verdict_payload.get("next_tests"))
     lines.append("")
 
     # Checklist
-    lines.extend(_list_section("Checklist", verdict_payload.get("checklist")))
+    _append_numbered(lines, "Checklist", verdict_payload.get("checklist"))
 
     # End with a trailing newline (nice for pipes and POSIX tools).
     return "\n".join(lines).strip() + "\n"
@@ -212,15 +299,31 @@ def export_one_pager(
 # ---------------------------------------------------------------------------
 
 
-def verdict_to_pdf(
+# (font, size, leading) for each header line of the PDF one-pager. The
+# leading is the gap to the next line. The whole header and the
+# recommendation paragraph are drawn as a single text object.
+_FONT_TITLE = ("Helvetica-Bold", 18, 0.4 * inch)
+_FONT_STAMP = ("Helvetica", 12, 0.3 * inch)
+_FONT_LABEL = ("Helvetica-Bold", 14, 0.25 * inch)
+_FONT_CC = ("Helvetica", 12, 0.3 * inch)
+_FONT_HEADING = ("Helvetica-Bold", 12, 0.2 * inch)
+_FONT_BODY = ("Helvetica", 11, 11 * 1.2)
+_FONT_FOOTER = ("Helvetica-Oblique", 9)
+
+_LINE_GAP = 0.2 * inch  # between bullet lines, and before each section heading
+_FOOTER_GAP = 0.15 * inch
+_BULLET_INDENT = 10  # points between a section heading and its bullets
+
+
+def verdict_to_pdf_bytes(
     verdict: Verdict,
     *,
-    output_path: Optional[Path | str] = None,
     title: str = "Guardrail Composability Verdict",
     metadata: Optional[Mapping[str, Any]] = None,
-) -> Path:
+    generated_at: Optional[str] = None,
+) -> bytes:
     """
-    Render a simple one-page PDF summary using ReportLab.
+    Render a simple one-page PDF summary using ReportLab, in memory.
 
     Layout (letter, portrait):
     - Title
@@ -230,146 +333,171 @@ def verdict_to_pdf(
     - Next Tests (bullets)
     - Checklist (bullets)
     - Optional metadata footer (key: value) right-aligned at bottom
+
+    `generated_at` overrides the timestamp, as in `build_payload`. Callers
+    that only need the bytes (e.g. to stream them) avoid any file I/O;
+    `verdict_to_pdf` writes them to disk.
     """
-    # Resolve output path
-    if output_path is None:
-        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-        tmp.close()
-        path = Path(tmp.name)
-    else:
-        path = Path(output_path)
+    from reportlab.pdfgen import canvas  # type: ignore[import-untyped]
 
-    c = canvas.Canvas(str(path), pagesize=letter)
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
     c.setTitle(title)
 
     width, height = letter
     margin = inch
-    y = height - margin
-
-    # Title
-    c.setFont("Helvetica-Bold", 18)
-    c.drawString(margin, y, title)
-    y -= 0.4 * inch
-
-    # Timestamp
-    c.setFont("Helvetica", 12)
-    c.drawString(margin, y, f"Generated: {datetime.now(timezone.utc).isoformat()}")
-    y -= 0.3 * inch
-
-    # Label + CC
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(margin, y, f"Label: {verdict.label}")
-    y -= 0.25 * inch
-
-    c.setFont("Helvetica", 12)
-    c.drawString(margin, y, f"CC = {verdict.CC:.3f}")
-    y -= 0.3 * inch
-
-    # Recommendation
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y, "Recommendation")
-    y -= 0.2 * inch
+    content_width = width - 2 * margin
+    # Bullet lines also leave room for their "• " / "  " prefix.
+    bullet_width = content_width - _BULLET_INDENT - max(
+        _word_width("• ", *_FONT_BODY[:2]), _word_width("  ", *_FONT_BODY[:2])
+    )
 
-    text_obj = c.beginText(margin, y)
-    text_obj.setFont("Helvetica", 11)
-    for line in _wrap_text(verdict.recommendation, width - 2 * margin):
+    # Header + recommendation paragraph
+    stamp = generated_at if generated_at is not None else _iso_now()
+    header = (
+        (_FONT_TITLE, title),
+        (_FONT_STAMP, f"Generated: {stamp}"),
+        (_FONT_LABEL, f"Label: {verdict.label}"),
+        (_FONT_CC, f"CC = {verdict.CC:.3f}"),
+        (_FONT_HEADING, "Recommendation"),
+    )
+    text_obj = c.beginText(margin, height - margin)
+    for (font, size, leading), line in header:
+        text_obj.setFont(font, size, leading)
+        text_obj.textLine(line)
+    text_obj.setFont(*_FONT_BODY)
+    for line in _wrap_text(verdict.recommendation, content_width):
         text_obj.textLine(line)
     c.drawText(text_obj)
 
-    y = text_obj.getY() - 0.2 * inch
-
-    # Next Tests
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y, "Next Tests")
-    y -= 0.2 * inch
-    y = _draw_bullets(c, list(verdict.next_tests), y, margin, width)
-
-    # Checklist
-    c.setFont("Helvetica-Bold", 12)
-    c.drawString(margin, y, "Checklist")
-    y -= 0.2 * inch
-    y = _draw_bullets(c, list(verdict.checklist), y, margin, width)
+    y = text_obj.getY() - _LINE_GAP
+    y = _draw_section(c, "Next Tests", verdict.next_tests, margin, y, bullet_width)
+    y = _draw_section(c, "Checklist", verdict.checklist, margin, y, bullet_width)
 
     # Optional metadata footer
     if metadata:
         footer_y = margin
-        c.setFont("Helvetica-Oblique", 9)
+        right = width - margin
+        c.setFont(*_FONT_FOOTER)
         for key, value in metadata.items():
-            c.drawRightString(
-                width - margin,
-                footer_y,
-                f"{key}: {value}",
-            )
-            footer_y += 0.15 * inch
+            c.drawRightString(right, footer_y, f"{key}: {value}")
+            footer_y += _FOOTER_GAP
 
     c.showPage()
     c.save()
-    return path
+    return buf.getvalue()
+
 
+def verdict_to_pdf(
+    verdict: Verdict,
+    *,
+    output_path: Optional[Path | str] = None,
+    title: str = "Guardrail Composability Verdict",
+    metadata: Optional[Mapping[str, Any]] = None,
+    generated_at: Optional[str] = None,
+) -> Path:
+    """
+    Render the PDF one-pager (see `verdict_to_pdf_bytes`) and write it to disk.
 
-def _wrap_text(text: str, max_width: float, avg_char_width: float = 6.0) -> list[str]:
+    The file goes to `output_path`, or to a fresh temporary `.pdf` file when
+    none is given; the written path is returned.
     """
-    Simple word wrap for ReportLab text objects.
+    data = verdict_to_pdf_bytes(
+        verdict, title=title, metadata=metadata, generated_at=generated_at
+    )
+
+    if output_path is None:
+        fd, name = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        return Path(name)
+
+    path = Path(output_path)
+    path.write_bytes(data)
+    return path
+
+
+@lru_cache(maxsize=4096)
+def _word_width(word: str, font_name: str, font_size: float) -> float:
+    """Rendered width of `word` in points (memoised; words recur across texts)."""
+    from reportlab.pdfbase.pdfmetrics import stringWidth  # type: ignore[import-untyped]
+
+    return stringWidth(word, font_name, font_size)
 
-    We approximate by:
-        max_chars = max_width / avg_char_width
 
-    This does not depend on font metrics but is good enough for short paragraphs.
+def _wrap_text(
+    text: str,
+    max_width: float,
+    font_name: str = _FONT_BODY[0],
+    font_size: float = _FONT_BODY[1],
+) -> list[str]:
+    """
+    Greedy word wrap for ReportLab text objects.
+
+    Lines are packed against the real rendered width of each word in the
+    given font (Helvetica 11 by default, matching the body text). Words are
+    never split, so a single word wider than `max_width` gets its own line.
     """
     if not text:
         return [""]
 
-    max_chars = max(int(max_width / avg_char_width), 1)
     words = text.split()
     lines: list[str] = []
-    current: list[str] = []
-
-    for word in words:
-        tentative = " ".join(current + [word]) if current else word
-        if len(tentative) > max_chars and current:
-            lines.append(" ".join(current))
-            current = [word]
-        else:
-            current.append(word)
-
-    if current:
-        lines.append(" ".join(current))
+    space = _word_width(" ", font_name, font_size)
+
+    # Track the current line's width instead of joining a tentative line per
+    # word; each emitted line is joined exactly once.
+    start = 0
+    running = -space  # width of words[start:i] joined by spaces
+    for i, word in enumerate(words):
+        width = _word_width(word, font_name, font_size)
+        running += space + width
+        if running > max_width and i > start:
+            lines.append(" ".join(words[start:i]))
+            start = i
+            running = width
+
+    if start < len(words):
+        lines.append(" ".join(words[start:]))
 
     return lines or [""]
 
 
-def _draw_bullets(
+def _draw_section(
     c: canvas.Canvas,
+    heading: str,
     items: Sequence[str],
+    x: float,
     start_y: float,
-    margin: float,
-    page_width: float,
+    max_width: float,
 ) -> float:
     """
-    Draw simple bullet-point text, returning the new y-coordinate.
+    Draw a bold section heading and its bullet list, returning the new y.
 
-    - Each item is prefixed with "• ".
-    - Long items are wrapped using `_wrap_text`.
+    - Each item is prefixed with "• " and indented `_BULLET_INDENT` points.
+    - Long items are wrapped to `max_width` using `_wrap_text`.
     - If `items` is empty, we print "(none)".
+
+    Heading and bullets go into one text object (one `BT ... ET` block in the
+    PDF) rather than a separate `drawString` per line.
     """
-    y = start_y
-    c.setFont("Helvetica", 11)
+    text_obj = c.beginText(x, start_y)
+    text_obj.setFont(*_FONT_HEADING)
+    text_obj.textLine(heading)
+    text_obj.setFont(_FONT_BODY[0], _FONT_BODY[1], _LINE_GAP)
+    text_obj.setXPos(_BULLET_INDENT)
 
     if not items:
-        c.drawString(margin + 10, y, "(none)")
-        return y - 0.2 * inch
-
-    available_width = page_width - (margin + 10) - margin
-
-    for item in items:
-        bullet_prefix = "• "
-        wrapped_lines = _wrap_text(item, available_width)
-        for idx, line in enumerate(wrapped_lines):
-            text = bullet_prefix + line if idx == 0 else "  " + line
-            c.drawString(margin + 10, y, text)
-            y -= 0.2 * inch
+        text_obj.textLine("(none)")
+    else:
+        for item in items:
+            wrapped_lines = _wrap_text(item, max_width)
+            text_obj.textLine("• " + wrapped_lines[0])
+            for line in wrapped_lines[1:]:
+                text_obj.textLine("  " + line)
 
-    return y
+    c.drawText(text_obj)
+    return text_obj.getY()
 
 
 # ---------------------------------------------------------------------------
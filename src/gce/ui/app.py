@@ -24,13 +24,15 @@ if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
 __all__ = ["build_interface", "launch"]
 
 
-def build_interface() -> "gr.Blocks":
+def build_interface(*, shared: bool = False) -> gr.Blocks:
     """
     Construct and return the main Gradio Blocks app defined in `gradio_app`.
 
     This is the preferred way to embed GCE into other scripts or notebooks.
+    Pass `shared=True` to reuse one process-wide instance instead of
+    building a new one.
     """
-    return _gradio_app.build_interface()
+    return _gradio_app.build_interface(shared=shared)
 
 
 def launch(**kwargs: Any) -> None:
@@ -18,14 +18,19 @@ This module is intentionally self-contained and stable:
     * JSON + PDF artifacts as downloadable files.
 
 `app.py` is a thin entrypoint that simply calls `build_interface()` and launches.
+
+Gradio (FastAPI, uvicorn, ...) takes seconds to import, and the optional AI
+explainer pulls in its own dependencies, so both are imported only where they
+are used. Importing this module for its helpers stays cheap.
 """
 
-import json
+import hashlib
+import os
 import tempfile
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import gradio as gr
 from pydantic import ValidationError
 
 from ..core.cc_surface.api import (
@@ -34,14 +39,10 @@ from ..core.cc_surface.api import (
     backend_info,
     compute_verdict,
 )
-from ..exporters.one_pager import verdict_to_json, verdict_to_pdf
+from ..exporters.one_pager import _iso_now, verdict_to_json, verdict_to_pdf
 
-# ai_explainer is optional: if it fails to import (e.g. missing openai),
-# we transparently fall back to a deterministic offline explainer.
-try:  # pragma: no cover - exercised indirectly via UI
-    from .. import ai_explainer as _ai_explainer  # type: ignore[import]
-except Exception:  # pragma: no cover - safe fallback
-    _ai_explainer = None  # type: ignore[assignment]
+if TYPE_CHECKING:  # pragma: no cover - import-time guard for type checkers
+    import gradio as gr
 
 # ---------------------------------------------------------------------------
 # Presentation constants
@@ -59,10 +60,44 @@ _SAMPLES_DIR = _ROOT_DIR / "examples"
 _SAMPLE_PATH = _SAMPLES_DIR / "sample_run_bundle.json"
 
 
+def _read_sample_text() -> str:
+    """Read the shipped sample bundle once; empty if it is missing/unreadable."""
+    try:
+        return _SAMPLE_PATH.read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+# The sample never changes while the server runs: read it once at import and
+# validate it at most once (see `_sample_bundle`).
+_SAMPLE_TEXT = _read_sample_text()
+
+
+@cache
+def _sample_bundle() -> RunBundle:
+    """The validated sample bundle, parsed on first use."""
+    return RunBundle.model_validate_json(_SAMPLE_TEXT)
+
+
 # ---------------------------------------------------------------------------
 # Helper: input loading
 # ---------------------------------------------------------------------------
 
+def _extract_upload_path(upload: Any) -> Optional[str]:
+    """
+    Filesystem path of a `gr.File` value, whatever shape the Gradio version uses.
+
+    - str / PathLike: `type="filepath"` (the default in Gradio 4+).
+    - dict: Gradio's FileData dict.
+    - object with `.name` / `.path`: tempfile wrappers and FileData objects.
+    """
+    if isinstance(upload, (str, os.PathLike)):
+        return os.fspath(upload)
+    if isinstance(upload, dict):
+        return upload.get("path") or upload.get("name")
+    return getattr(upload, "name", None) or getattr(upload, "path", None)
+
+
 def _load_bundle_text(text: str, upload: Optional[Any]) -> str:
     """
     Choose a JSON payload source in the following priority:
@@ -81,31 +116,23 @@ def _load_bundle_text(text: str, upload: Optional[Any]) -> str:
     if candidate:
         return candidate
 
-    # 2) Try the uploaded file (gr.File or dict-like, depending on Gradio version).
-    if upload is not None:
-        upload_path: Optional[str] = None
-        if isinstance(upload, dict):
-            # Gradio's FileData dict (newer versions).
-            upload_path = upload.get("name") or upload.get("path")
-        elif hasattr(upload, "name"):
-            # e.g., tempfile.NamedTemporaryFile or similar.
-            upload_path = getattr(upload, "name")
-
-        if upload_path:
-            try:
-                return Path(upload_path).read_text(encoding="utf-8")
-            except OSError as exc:  # file vanished / permissions / etc.
-                raise gr.Error(f"Failed to read uploaded file: {exc}") from exc
+    # 2) Try the uploaded file.
+    upload_path = _extract_upload_path(upload) if upload else None
+    if upload_path:
+        try:
+            return Path(upload_path).read_bytes().decode("utf-8")
+        except OSError as exc:  # file vanished / permissions / etc.
+            import gradio as gr
+
+            raise gr.Error(f"Failed to read uploaded file: {exc}") from exc
 
     # 3) Fallback to local sample file, if shipped with the package.
-    if _SAMPLE_PATH.exists():
-        try:
-            return _SAMPLE_PATH.read_text(encoding="utf-8")
-        except OSError:
-            # If even this fails, fall through to error.
-            pass
+    if _SAMPLE_TEXT:
+        return _SAMPLE_TEXT
 
     # 4) Nothing to work with.
+    import gradio as gr
+
     raise gr.Error(
         "No run bundle provided.\n\n"
         "Please either:\n"
@@ -119,6 +146,29 @@ def _load_bundle_text(text: str, upload: Optional[Any]) -> str:
 # Helper: deterministic explanation (offline coach)
 # ---------------------------------------------------------------------------
 
+# Fixed prose for the offline explainer, keyed by verdict label.
+_INDEPENDENT_INTERPRETATION = (
+    "This means the composition is essentially neutral: performance is "
+    "within the expected noise band of the best singleton."
+)
+_VERDICT_INTERPRETATION: Dict[str, str] = {
+    "Constructive": (
+        "This means the composition is outperforming the best singleton: "
+        "you are gaining signal by combining guardrails rather than running "
+        "them in isolation."
+    ),
+    "Destructive": (
+        "This means the composition is *worse* than the best singleton: "
+        "some interaction between guardrails is degrading performance."
+    ),
+    "Independent": _INDEPENDENT_INTERPRETATION,
+}
+_LLM_ERROR_NOTE = (
+    "\n\n> Note: The online AI explainer is temporarily unavailable; "
+    "this summary was generated by GCE's built-in template logic.\n"
+)
+
+
 def _best_baseline(bundle: RunBundle) -> Tuple[str, float]:
     """
     Compute the best-performing singleton according to the bundle objective.
@@ -130,12 +180,10 @@ def _best_baseline(bundle: RunBundle) -> Tuple[str, float]:
     if not bundle.J_baselines:
         return "<none>", float("nan")
 
-    items = bundle.J_baselines.items()
-    if bundle.objective == "maximize":
-        name, val = max(items, key=lambda kv: float(kv[1]))
-    else:
-        name, val = min(items, key=lambda kv: float(kv[1]))
-    return name, float(val)
+    baselines = bundle.J_baselines
+    pick = max if bundle.objective == "maximize" else min
+    name = pick(baselines, key=baselines.__getitem__)
+    return name, float(baselines[name])
 
 
 def _offline_ai_explanation(
@@ -155,7 +203,6 @@ def _offline_ai_explanation(
     """
     best_name, best_val = _best_baseline(bundle)
     label = verdict.label
-    cc_val = verdict.CC
 
     baseline_clause = ""
     if bundle.J_baselines:
@@ -164,47 +211,19 @@ def _offline_ai_explanation(
             f"with J ≈ {best_val:.3g}. "
         )
 
-    core_line = (
-        f"The composed system using rule '{bundle.rule}' at θ={bundle.theta:.2f} "
-        f"achieved J_composed ≈ {bundle.J_composed:.3g}, yielding a "
-        f"composability coefficient CC ≈ {cc_val:.2f} and a **{label}** verdict "
-        f"for objective='{bundle.objective}'."
-    )
-
-    if label == "Constructive":
-        verdict_interpretation = (
-            "This means the composition is outperforming the best singleton: "
-            "you are gaining signal by combining guardrails rather than running "
-            "them in isolation."
-        )
-    elif label == "Destructive":
-        verdict_interpretation = (
-            "This means the composition is *worse* than the best singleton: "
-            "some interaction between guardrails is degrading performance."
-        )
-    else:  # Independent
-        verdict_interpretation = (
-            "This means the composition is essentially neutral: performance is "
-            "within the expected noise band of the best singleton."
-        )
-
     next_hint = ""
     if verdict.next_tests:
-        next_hint = (
-            f"\n\nA strong next experiment is:\n- {verdict.next_tests[0]}"
-        )
+        next_hint = f"\n\nA strong next experiment is:\n- {verdict.next_tests[0]}"
 
-    error_note = ""
-    mode_label = "offline-template"
-    if error is not None:
-        mode_label = "offline-template (LLM error)"
-        error_note = (
-            "\n\n> Note: The online AI explainer is temporarily unavailable; "
-            "this summary was generated by GCE's built-in template logic.\n"
-        )
+    mode_label = "offline-template" if error is None else "offline-template (LLM error)"
+    error_note = "" if error is None else _LLM_ERROR_NOTE
 
     text = (
-        f"{baseline_clause}{core_line} {verdict_interpretation}"
+        f"{baseline_clause}The composed system using rule '{bundle.rule}' at "
+        f"θ={bundle.theta:.2f} achieved J_composed ≈ {bundle.J_composed:.3g}, "
+        f"yielding a composability coefficient CC ≈ {verdict.CC:.2f} and a "
+        f"**{label}** verdict for objective='{bundle.objective}'. "
+        f"{_VERDICT_INTERPRETATION.get(label, _INDEPENDENT_INTERPRETATION)}"
         f"{next_hint}{error_note}"
     )
 
@@ -215,15 +234,30 @@ def _offline_ai_explanation(
 # Helper: AI explainer integration (hybrid coach)
 # ---------------------------------------------------------------------------
 
+@cache
+def _get_ai_explainer() -> Optional[Any]:
+    """
+    Import `gce.ai_explainer` on first use.
+
+    The explainer is optional: if it fails to import (e.g. missing openai),
+    return None and callers fall back to the deterministic offline explainer.
+    """
+    try:  # pragma: no cover - exercised indirectly via UI
+        from .. import ai_explainer
+    except Exception:  # pragma: no cover - safe fallback
+        return None
+    return ai_explainer
+
+
 def _generate_ai_summary(
     bundle: RunBundle,
     verdict: Verdict,
 ) -> Tuple[str, str]:
     """
-    Route to the AI explainer if available, otherwise fall back to the
-    deterministic offline explainer.
+    Route to `gce.ai_explainer.explain_verdict` if it imports, otherwise
+    fall back to the deterministic offline explainer.
 
-    Expected contract for `gce.ai_explainer` (if present):
+    The explainer's contract:
 
         def explain_verdict(
             bundle: RunBundle,
@@ -233,13 +267,15 @@ def _generate_ai_summary(
             ...
 
     Where the optional second element in the tuple is a mode label such as
-    "online-llm" or "offline-fallback". Any exceptions are caught and turned
-    into a clean offline explanation.
+    "online-llm" or "offline-fallback". Its LLM calls are bounded by the
+    explainer's per-request timeout; any exception (timeouts included) is
+    caught and turned into a clean offline explanation.
     """
-    if _ai_explainer is not None:
-        explain = getattr(_ai_explainer, "explain_verdict", None)
+    ai_explainer = _get_ai_explainer()
+    if ai_explainer is not None:
+        explain = getattr(ai_explainer, "explain_verdict", None)
         if callable(explain):
-            try:  # pragma: no cover - behaviour exercised via UI, not unit tests
+            try:
                 result = explain(bundle=bundle, verdict=verdict, max_words=240)  # type: ignore[call-arg]
                 if isinstance(result, tuple) and result:
                     text = str(result[0])
@@ -263,24 +299,34 @@ def _generate_ai_summary(
 # Helper: formatting
 # ---------------------------------------------------------------------------
 
+def _chip_prefix(label: str, color: str) -> str:
+    """HTML for the label chip up to (and including) the "CC=" text."""
+    return (
+        "<div style='display:inline-flex;align-items:center;gap:0.5rem;'>"
+        "<span style='padding:0.35rem 0.75rem;border-radius:999px;"
+        f"background:{color};color:white;font-weight:600;'>"
+        f"{label}</span>"
+        "<span style='font-family:monospace;'>CC="
+    )
+
+
+_DEFAULT_LABEL_COLOR = "#4A4A4A"
+# Chip HTML for the known labels, pre-rendered so only CC varies per call.
+_CHIP_PREFIX: Dict[str, str] = {
+    label: _chip_prefix(label, color) for label, color in _LABEL_COLORS.items()
+}
+
+
 def _format_label_chip(label: str, cc: float) -> str:
     """
     Render the verdict label + CC as a small HTML chip.
 
     This is pure presentation: the backend only cares about the raw values.
     """
-    color = _LABEL_COLORS.get(label, "#4A4A4A")
-    label_html = (
-        f"<span style='padding:0.35rem 0.75rem;border-radius:999px;"
-        f"background:{color};color:white;font-weight:600;'>"
-        f"{label}</span>"
-    )
-    cc_html = f"<span style='font-family:monospace;'>CC={cc:.3f}</span>"
-    return (
-        "<div style='display:inline-flex;align-items:center;gap:0.5rem;'>"
-        f"{label_html}{cc_html}"
-        "</div>"
-    )
+    prefix = _CHIP_PREFIX.get(label)
+    if prefix is None:
+        prefix = _chip_prefix(label, _DEFAULT_LABEL_COLOR)
+    return f"{prefix}{cc:.3f}</span></div>"
 
 
 def _list_to_md(items: list[str], header: str) -> str:
@@ -289,26 +335,119 @@ def _list_to_md(items: list[str], header: str) -> str:
     """
     if not items:
         return f"### {header}\n_No data_"
-    bullets = "\n".join(f"- {item}" for item in items)
-    return f"### {header}\n{bullets}"
+    return f"### {header}\n- " + "\n- ".join(items)
 
 
 # ---------------------------------------------------------------------------
 # Core Gradio callback
 # ---------------------------------------------------------------------------
 
+def _parse_bundle(payload_text: str) -> RunBundle:
+    """
+    Validate bundle JSON into a RunBundle, mapping failures to `gr.Error`.
+
+    pydantic-core parses and validates in one pass, without building an
+    intermediate dict through the stdlib json module.
+    """
+    try:
+        if _SAMPLE_TEXT and payload_text == _SAMPLE_TEXT:
+            return _sample_bundle()
+        return RunBundle.model_validate_json(payload_text)
+    except ValidationError as exc:
+        import gradio as gr
+
+        errors = exc.errors()
+        if errors and errors[0]["type"] == "json_invalid":
+            raise gr.Error(f"Invalid JSON in run bundle: {errors[0]['msg']}") from exc
+        raise gr.Error(f"RunBundle schema validation failed: {exc}") from exc
+
+
+@cache
+def _export_dir() -> Path:
+    """Per-process directory holding every JSON/PDF download this app writes."""
+    return Path(tempfile.mkdtemp(prefix="gce_"))
+
+
+def _export_stem(payload_text: str) -> str:
+    """Stable file stem for a bundle text's downloads."""
+    digest = hashlib.blake2b(payload_text.encode("utf-8"), digest_size=8).hexdigest()
+    return f"verdict-{digest}"
+
+
+def _export_path(payload_text: str, suffix: str) -> Path:
+    """
+    Download path for one bundle text, e.g. `<export dir>/verdict-<digest>.pdf`.
+
+    Files are named after the bundle text, so re-exporting a bundle (e.g.
+    after it fell out of the `_verdict_for` cache) overwrites its previous
+    files instead of leaving more temp files behind.
+    """
+    out_dir = _export_dir()
+    out_dir.mkdir(parents=True, exist_ok=True)  # in case a tmp cleaner removed it
+    return out_dir / f"{_export_stem(payload_text)}{suffix}"
+
+
+def _write_json_export(
+    payload_text: str, bundle: RunBundle, verdict: Verdict, stamp: str
+) -> str:
+    """Write the JSON download (verdict + bundle for context); return its path."""
+    path = _export_path(payload_text, ".json")
+    path.write_text(
+        verdict_to_json(verdict, bundle=bundle, generated_at=stamp), encoding="utf-8"
+    )
+    # A PDF rendered under an older timestamp would disagree with this JSON;
+    # `_pdf_download` re-renders it on demand.
+    path.with_suffix(".pdf").unlink(missing_ok=True)
+    return str(path)
+
+
+@lru_cache(maxsize=32)
+def _verdict_for(payload_text: str) -> Tuple[RunBundle, Verdict, str, str]:
+    """
+    Parse, validate, compute and JSON-export one bundle text, memoised on it.
+
+    Returns (bundle, verdict, stamp, json_path), where `stamp` is the export
+    timestamp shared by the JSON and (later) PDF downloads so the two agree.
+    Users often click "Compute" repeatedly on unchanged input (e.g. to
+    re-download the exports); those clicks reuse the verdict and the files
+    already written. Errors are raised, not cached.
+    """
+    bundle = _parse_bundle(payload_text)
+    verdict = compute_verdict(bundle)
+    stamp = _iso_now()
+    json_path = _write_json_export(payload_text, bundle, verdict, stamp)
+    return bundle, verdict, stamp, json_path
+
+
+def _coach_markdown(bundle: RunBundle, verdict: Verdict) -> str:
+    """AI coach explanation (hybrid LLM/offline) rendered for the Markdown panel."""
+    ai_text, ai_mode = _generate_ai_summary(bundle, verdict)
+    return f"**Mode:** `{ai_mode}`\n\n{ai_text}"
+
+
+_COACH_DISABLED_MD = (
+    "**Mode:** `disabled`\n\n"
+    "Tick **Generate AI Coach Explanation** or press **Explain** to generate one."
+)
+
+
 def _compute(
     bundle_text: str,
     upload: Optional[Any],
-) -> Tuple[str, str, str, str, str, str, str]:
+    enable_coach: bool = False,
+) -> Tuple[str, str, str, str, str, str, None, str]:
     """
     Core Gradio callback:
 
     - Resolve bundle JSON from text/upload/sample.
     - Validate into a RunBundle.
     - Compute Verdict through the cc-surface API.
-    - Generate an AI explanation (LLM-backed when available).
-    - Materialise JSON + PDF artifacts on disk.
+    - Generate an AI explanation (LLM-backed when available), only if
+      `enable_coach` is set; otherwise `_explain` produces it on demand.
+    - Materialise the JSON artifact on disk.
+
+    The PDF is not rendered here: `_pdf_download` runs as a follow-up event
+    so the verdict shows up without waiting on reportlab.
 
     Returns (in order):
         1) HTML verdict chip,
@@ -317,41 +456,22 @@ def _compute(
         4) Checklist markdown,
         5) AI Coach Explanation markdown,
         6) *Path* to JSON file (for DownloadButton),
-        7) *Path* to PDF file (for DownloadButton).
+        7) None, clearing the PDF DownloadButton until `_pdf_download` fills it,
+        8) The resolved bundle text, kept in session state for `_pdf_download`.
     """
-    try:
-        payload_text = _load_bundle_text(bundle_text, upload)
-        payload = json.loads(payload_text)
-        bundle = RunBundle.model_validate(payload)
-    except json.JSONDecodeError as exc:
-        raise gr.Error(f"Invalid JSON in run bundle: {exc}") from exc
-    except ValidationError as exc:
-        raise gr.Error(f"RunBundle schema validation failed: {exc}") from exc
-
-    verdict = compute_verdict(bundle)
+    payload_text = _load_bundle_text(bundle_text, upload)
+    bundle, verdict, stamp, json_path = _verdict_for(payload_text)
+    if not Path(json_path).exists():
+        # A cached export was cleaned up; write a fresh file for this click.
+        json_path = _write_json_export(payload_text, bundle, verdict, stamp)
 
     label_chip_html = _format_label_chip(verdict.label, verdict.CC)
     recommendation = verdict.recommendation
     next_tests_md = _list_to_md(verdict.next_tests, "Next Tests")
     checklist_md = _list_to_md(verdict.checklist, "Checklist")
 
-    # AI coach explanation (hybrid LLM/offline).
-    ai_text, ai_mode = _generate_ai_summary(bundle, verdict)
-    ai_md = f"**Mode:** `{ai_mode}`\n\n{ai_text}"
-
-    # Include bundle in the JSON export for context.
-    json_blob = verdict_to_json(verdict, bundle=bundle)
-
-    # DownloadButton expects a *file*, not a raw JSON string.
-    # Persist to a temp file and return its path.
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".json")
-    tmp.write(json_blob.encode("utf-8"))
-    tmp.flush()
-    tmp.close()
-    json_path = tmp.name
-
-    # PDF path is already a real file path from verdict_to_pdf.
-    pdf_path = verdict_to_pdf(verdict)
+    # The coach may call out to an LLM, so it is opt-in per click.
+    ai_md = _coach_markdown(bundle, verdict) if enable_coach else _COACH_DISABLED_MD
 
     return (
         label_chip_html,
@@ -360,15 +480,71 @@ def _compute(
         checklist_md,
         ai_md,
         json_path,
-        str(pdf_path),
+        None,
+        payload_text,
     )
 
 
+def _compute_changed(
+    bundle_text: str,
+    upload: Optional[Any],
+    enable_coach: bool,
+    previous: Optional[Tuple[Any, ...]],
+) -> Tuple[Any, ...]:
+    """
+    Gradio wrapper around `_compute` that only re-sends panels that changed.
+
+    `previous` is the session's last `_compute` result (held in a `gr.State`).
+    When the bundle text is the same as last time, visible outputs that did
+    not change are returned as a no-op `gr.update()`, so a repeat click ships
+    almost nothing to the browser. Export paths are stable per bundle text,
+    so they compare equal too, and the PDF button keeps its file. A new
+    bundle refreshes every panel. The resolved bundle text and the new
+    `previous` are always returned.
+    """
+    outputs = _compute(bundle_text, upload, enable_coach)
+    *panels, payload_text = outputs
+    updates: List[Any] = panels
+
+    if previous is not None and previous[-1] == payload_text:
+        import gradio as gr
+
+        updates = [
+            gr.update() if new == old else new for new, old in zip(panels, previous)
+        ]
+
+    return (*updates, payload_text, outputs)
+
+
+def _explain(payload_text: Optional[str]) -> str:
+    """Gradio callback for the "Explain" button: coach the last computed bundle."""
+    if not payload_text:
+        return "Press **Compute verdict** first."
+    bundle, verdict, _, _ = _verdict_for(payload_text)
+    return _coach_markdown(bundle, verdict)
+
+
+def _pdf_download(payload_text: Optional[str]) -> Optional[str]:
+    """
+    Follow-up Gradio callback: render (or reuse) the PDF for the last bundle.
+
+    Runs after `_compute` succeeds. The verdict and timestamp come from the
+    `_verdict_for` cache, so nothing is recomputed.
+    """
+    if not payload_text:
+        return None
+    path = _export_path(payload_text, ".pdf")
+    if not path.exists():
+        _, verdict, stamp, _ = _verdict_for(payload_text)
+        verdict_to_pdf(verdict, output_path=path, generated_at=stamp)
+    return str(path)
+
+
 # ---------------------------------------------------------------------------
 # Public interface (Blocks builder + launcher)
 # ---------------------------------------------------------------------------
 
-def build_interface() -> gr.Blocks:
+def build_interface(*, shared: bool = False) -> gr.Blocks:
     """
     Construct the Gradio Blocks app but do not launch it.
 
@@ -376,13 +552,28 @@ def build_interface() -> gr.Blocks:
     - gce.ui.app (thin entrypoint),
     - tests or ad-hoc scripts that want an object handle,
     - other tools embedding GCE as a component.
+
+    Each call returns a fresh, unlaunched Blocks instance. Pass
+    `shared=True` to reuse one process-wide instance instead, skipping the
+    rebuild; callers that opt in share its UI state and must launch it at
+    most once.
     """
-    default_text = ""
-    if _SAMPLE_PATH.exists():
-        try:
-            default_text = _SAMPLE_PATH.read_text(encoding="utf-8")
-        except OSError:
-            default_text = ""
+    if shared:
+        return _shared_blocks()
+    return _build_blocks()
+
+
+@cache
+def _shared_blocks() -> gr.Blocks:
+    """The process-wide Blocks instance behind `build_interface(shared=True)`."""
+    return _build_blocks()
+
+
+def _build_blocks() -> gr.Blocks:
+    """Construct every component and event of the GCE Blocks app."""
+    import gradio as gr
+
+    default_text = _SAMPLE_TEXT
 
     # Try to fetch backend metadata for a tiny status footer.
     try:
@@ -421,7 +612,12 @@ def build_interface() -> gr.Blocks:
                 file_types=[".json"],
             )
 
-        compute_btn = gr.Button("Compute verdict", variant="primary")
+        with gr.Row():
+            compute_btn = gr.Button("Compute verdict", variant="primary")
+            enable_coach = gr.Checkbox(
+                label="Generate AI Coach Explanation",
+                value=False,
+            )
 
         verdict_chip = gr.HTML(label="Verdict")
         rec_output = gr.Textbox(
@@ -435,14 +631,20 @@ def build_interface() -> gr.Blocks:
             label="AI Coach Explanation",
             value="Press **Compute verdict** to generate an explanation.",
         )
+        explain_btn = gr.Button("Explain")
 
         # Download buttons: used as *outputs*; the callback returns file paths.
         download_json = gr.DownloadButton("Export JSON")
         download_pdf = gr.DownloadButton("Download PDF")
 
+        # Resolved bundle text of the last successful compute, for the PDF step.
+        last_payload = gr.State(None)
+        # The previous `_compute` result, so unchanged panels can be skipped.
+        last_outputs = gr.State(None)
+
         compute_btn.click(
-            _compute,
-            inputs=[bundle_text, bundle_file],
+            _compute_changed,
+            inputs=[bundle_text, bundle_file, enable_coach, last_outputs],
             outputs=[
                 verdict_chip,
                 rec_output,
@@ -451,7 +653,18 @@ def build_interface() -> gr.Blocks:
                 ai_explanation,
                 download_json,
                 download_pdf,
+                last_payload,
+                last_outputs,
             ],
+        ).success(
+            _pdf_download,
+            inputs=[last_payload],
+            outputs=[download_pdf],
+        )
+        explain_btn.click(
+            _explain,
+            inputs=[last_payload],
+            outputs=[ai_explanation],
         )
 
     return demo
@@ -1,9 +1,47 @@
 from __future__ import annotations
 
-import sys
+import importlib
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+import pytest
+
+# `src/` is put on sys.path by `pythonpath` in [tool.pytest.ini_options].
+
+
+@pytest.fixture(scope="session")
+def sample_verdict():
+    """
+    (bundle dict, Verdict) for the canonical sample bundle, computed once.
+
+    The CC-surface API is reloaded from a clean module state first, so the
+    backend selection logic (fallback vs cc-framework) is exercised. Tests
+    must not mutate the shared bundle; use `load_sample_bundle()` for a copy.
+    """
+    from tests.utils import load_sample_bundle, reset_backend_modules
+
+    reset_backend_modules()
+    import gce.core.cc_surface.api as api  # local import to respect reset
+
+    importlib.reload(api)
+    bundle = load_sample_bundle()
+    return bundle, api.compute_verdict_from_params(**bundle)
+
+
+@pytest.fixture(scope="session")
+def exports_dir(tmp_path_factory) -> Path:
+    """
+    One scratch directory shared by the exporter tests.
+
+    Tests writing here must pick unique file names (e.g. with a uuid4 suffix).
+    """
+    return tmp_path_factory.mktemp("exports")
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(exports_dir: Path, sample_verdict) -> Path:
+    """The sample verdict rendered to a PDF once per session."""
+    from gce.exporters import one_pager
+
+    _, verdict = sample_verdict
+    target = exports_dir / "verdict.pdf"
+    return one_pager.verdict_to_pdf(verdict, output_path=target)
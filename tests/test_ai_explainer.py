@@ -0,0 +1,192 @@
+"""
+Tests for gce.ai_explainer
+
+No network access and no real OpenAI client are required: online paths use
+a stub client that records its requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from gce import ai_explainer
+from gce.core.cc_surface.api import RunBundle, compute_verdict
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client_cache():
+    """Each test sees (and leaves behind) empty client caches."""
+    ai_explainer._get_client.cache_clear()
+    ai_explainer._get_async_client.cache_clear()
+    yield
+    ai_explainer._get_client.cache_clear()
+    ai_explainer._get_async_client.cache_clear()
+
+
+def test_get_client_without_api_key_is_none(monkeypatch):
+    """No OPENAI_API_KEY means offline mode."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    assert ai_explainer._get_client() is None
+
+
+def test_failed_client_construction_is_cached_as_none(monkeypatch):
+    """
+    If the openai package cannot be used, the client resolves to None once and
+    that result is reused instead of retrying the import on every call.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    # A None entry in sys.modules makes `from openai import ...` raise ImportError.
+    monkeypatch.setitem(sys.modules, "openai", None)
+
+    assert ai_explainer._get_client() is None
+    assert ai_explainer._get_client() is None
+    assert ai_explainer._get_client.cache_info().hits == 1
+
+
+def test_clients_are_built_with_bounded_timeout(monkeypatch):
+    """Both clients get the module deadline instead of the openai defaults."""
+    seen = []
+
+    class _Recorder:
+        def __init__(self, **kwargs):
+            seen.append(kwargs)
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setitem(
+        sys.modules,
+        "openai",
+        types.SimpleNamespace(OpenAI=_Recorder, AsyncOpenAI=_Recorder),
+    )
+
+    assert isinstance(ai_explainer._get_client(), _Recorder)
+    assert isinstance(ai_explainer._get_async_client(), _Recorder)
+    expected = {
+        "timeout": ai_explainer._REQUEST_TIMEOUT_S,
+        "max_retries": ai_explainer._MAX_RETRIES,
+    }
+    assert seen == [expected, expected]
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (None, ai_explainer._DEFAULT_TIMEOUT_S),
+        ("2.5", 2.5),
+        ("abc", ai_explainer._DEFAULT_TIMEOUT_S),
+        ("0", ai_explainer._DEFAULT_TIMEOUT_S),
+        ("-3", ai_explainer._DEFAULT_TIMEOUT_S),
+        ("inf", ai_explainer._DEFAULT_TIMEOUT_S),
+        ("nan", ai_explainer._DEFAULT_TIMEOUT_S),
+    ],
+)
+def test_timeout_from_env_falls_back_on_bad_values(monkeypatch, raw, expected):
+    """GCE_AI_TIMEOUT accepts positive seconds; anything else uses the default."""
+    if raw is None:
+        monkeypatch.delenv("GCE_AI_TIMEOUT", raising=False)
+    else:
+        monkeypatch.setenv("GCE_AI_TIMEOUT", raw)
+
+    assert ai_explainer._timeout_from_env() == expected
+
+
+def test_explain_with_ai_offline_fallback(monkeypatch):
+    """Without a client, explain_with_ai returns the deterministic summary."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    bundle = RunBundle(
+        theta=0.5,
+        rule="blend",
+        J_baselines={"A": 0.3},
+        J_composed=0.2,
+    )
+    verdict = compute_verdict(bundle)
+
+    text = ai_explainer.explain_with_ai(bundle, verdict)
+
+    assert "offline mode" in text
+    assert verdict.label in text
+
+
+def test_gather_explanations_offline_preserves_order(monkeypatch):
+    """The async fan-out returns one offline explanation per pair, in order."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    bundles = [
+        RunBundle(theta=theta, rule=f"rule-{idx}", J_baselines={"A": 0.3}, J_composed=0.2)
+        for idx, theta in enumerate((0.1, 0.5, 0.9))
+    ]
+    pairs = [(bundle, compute_verdict(bundle)) for bundle in bundles]
+
+    texts = asyncio.run(ai_explainer.gather_explanations(pairs, max_concurrency=2))
+
+    assert len(texts) == 3
+    for idx, text in enumerate(texts):
+        assert f"`rule-{idx}`" in text
+
+
+class _StubClient:
+    """Minimal stand-in for OpenAI(): records create() kwargs, replies or raises."""
+
+    def __init__(self, reply="", error=None):
+        self.calls = []
+        self._reply = reply
+        self._error = error
+        self.chat = types.SimpleNamespace(
+            completions=types.SimpleNamespace(create=self._create)
+        )
+
+    def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        if self._error is not None:
+            raise self._error
+        message = types.SimpleNamespace(content=self._reply)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+def _sample_pair():
+    bundle = RunBundle(theta=0.5, rule="blend", J_baselines={"A": 0.3}, J_composed=0.2)
+    return bundle, compute_verdict(bundle)
+
+
+def test_explain_verdict_offline_and_online(monkeypatch):
+    """explain_verdict reports its mode and passes the word cap and deadline."""
+    bundle, verdict = _sample_pair()
+    ai_explainer._complete.cache_clear()
+
+    monkeypatch.setattr(ai_explainer, "_get_client", lambda: None)
+    text, mode = ai_explainer.explain_verdict(bundle, verdict)
+    assert mode == "offline-fallback"
+    assert "offline mode" in text
+
+    client = _StubClient(reply="  **Coached.**  ")
+    monkeypatch.setattr(ai_explainer, "_get_client", lambda: client)
+    text, mode = ai_explainer.explain_verdict(bundle, verdict, max_words=120)
+
+    assert (text, mode) == ("**Coached.**", "online-llm")
+    (call,) = client.calls
+    assert call["timeout"] == ai_explainer._REQUEST_TIMEOUT_S
+    assert "Keep it under 120 words." in call["messages"][1]["content"]
+    ai_explainer._complete.cache_clear()
+
+
+def test_gradio_coach_uses_explainer_and_degrades_on_timeout(monkeypatch):
+    """The UI coach goes through explain_verdict; a timeout yields the offline template."""
+    from gce.ui import gradio_app
+
+    bundle, verdict = _sample_pair()
+    ai_explainer._complete.cache_clear()
+
+    monkeypatch.setattr(ai_explainer, "_get_client", lambda: _StubClient(reply="From the model."))
+    assert gradio_app._generate_ai_summary(bundle, verdict) == ("From the model.", "online-llm")
+    ai_explainer._complete.cache_clear()
+
+    stalled = _StubClient(error=TimeoutError("request timed out"))
+    monkeypatch.setattr(ai_explainer, "_get_client", lambda: stalled)
+    text, mode = gradio_app._generate_ai_summary(bundle, verdict)
+
+    assert mode == "offline-template (LLM error)"
+    assert verdict.label in text
+    assert len(stalled.calls) == 1
@@ -15,18 +15,48 @@ They pin down:
 - Next tests + checklist scaffolding
 """
 
-import sys
-from pathlib import Path
-
 import pytest
+from pydantic import ValidationError
+
+from gce.core.cc_surface.api import (  # type: ignore[import-untyped]
+    RunBundle,
+    compute_verdict,
+    compute_verdicts_batch,
+)
 
-# Ensure local "src" layout wins over any globally installed gce
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
+# Expected narrative for the minimize / Constructive contract case.
+_EXPECTED_MIN_RECOMMENDATION = (
+    "Lean into the synergy. Rule 'blend' at θ=0.30 delivers 0.8 "
+    "vs singleton 'A'=1 (CC=0.80, objective=minimize). Patterns in play: prior, denoiser."
+)
+_EXPECTED_MIN_NEXT = (
+    "Expand the θ sweep around 0.30 for rule 'blend' to map the constructive window.",
+    "Run leave-one-pattern-out ablations for prior, denoiser to verify their individual lifts.",
+    "Re-evaluate singleton 'A' to confirm the minimize reference (1).",
+)
+_EXPECTED_MIN_CHECKLIST = (
+    "Confirm objective='minimize' aligns with how J is interpreted.",
+    "Ensure 2 singleton baselines use the same dataset and evaluation seed as the composition.",
+    "Document how θ=0.30 for rule 'blend' was chosen.",
+    "Ensure instrumentation exists for patterns: prior, denoiser.",
+)
 
-from gce.core.cc_surface.api import RunBundle, compute_verdict  # type: ignore[import-untyped]
+# Expected narrative for the maximize / Destructive contract case.
+_EXPECTED_MAX_RECOMMENDATION = (
+    "Dial back the composition until diagnostics improve. "
+    "Rule 'gated' at θ=0.50 delivers 30 vs singleton 'alpha'=50 (CC=1.67, objective=maximize)."
+)
+_EXPECTED_MAX_NEXT = (
+    "Re-run singleton 'alpha' (50) as the fallback while disabling rule 'gated'.",
+    "Probe lower θ values than 0.50 to find a safer operating point.",
+    "Audit the composed pipeline for unexpected interactions, data leakage, or misconfigured guards.",
+)
+_EXPECTED_MAX_CHECKLIST = (
+    "Confirm objective='maximize' aligns with how J is interpreted.",
+    "Ensure 2 singleton baselines use the same dataset and evaluation seed as the composition.",
+    "Document how θ=0.50 for rule 'gated' was chosen.",
+    "Record why no pattern diagnostics were supplied.",
+)
 
 
 def test_compute_verdict_minimize_constructive_path() -> None:
@@ -52,26 +82,13 @@ def test_compute_verdict_minimize_constructive_path() -> None:
     assert verdict.label == "Constructive"
 
     # Recommendation narrative is part of the contract.
-    assert (
-        verdict.recommendation
-        == "Lean into the synergy. Rule 'blend' at θ=0.30 delivers 0.8 "
-        "vs singleton 'A'=1 (CC=0.80, objective=minimize). Patterns in play: prior, denoiser."
-    )
+    assert verdict.recommendation == _EXPECTED_MIN_RECOMMENDATION
 
     # Next tests should suggest exploring θ, ablations, and re-checking the baseline.
-    assert verdict.next_tests == [
-        "Expand the θ sweep around 0.30 for rule 'blend' to map the constructive window.",
-        "Run leave-one-pattern-out ablations for prior, denoiser to verify their individual lifts.",
-        "Re-evaluate singleton 'A' to confirm the minimize reference (1).",
-    ]
+    assert tuple(verdict.next_tests) == _EXPECTED_MIN_NEXT
 
     # Checklist should enforce objective clarity, dataset parity, θ documentation, and instrumentation.
-    assert verdict.checklist == [
-        "Confirm objective='minimize' aligns with how J is interpreted.",
-        "Ensure 2 singleton baselines use the same dataset and evaluation seed as the composition.",
-        "Document how θ=0.30 for rule 'blend' was chosen.",
-        "Ensure instrumentation exists for patterns: prior, denoiser.",
-    ]
+    assert tuple(verdict.checklist) == _EXPECTED_MIN_CHECKLIST
 
 
 def test_compute_verdict_maximize_destructive_path() -> None:
@@ -97,21 +114,144 @@ def test_compute_verdict_maximize_destructive_path() -> None:
     assert verdict.label == "Destructive"
 
     # Destructive story: revert to singleton, probe lower θ, audit interactions.
-    assert (
-        verdict.recommendation
-        == "Dial back the composition until diagnostics improve. "
-        "Rule 'gated' at θ=0.50 delivers 30 vs singleton 'alpha'=50 (CC=1.67, objective=maximize)."
-    )
+    assert verdict.recommendation == _EXPECTED_MAX_RECOMMENDATION
+    assert tuple(verdict.next_tests) == _EXPECTED_MAX_NEXT
+    assert tuple(verdict.checklist) == _EXPECTED_MAX_CHECKLIST
 
-    assert verdict.next_tests == [
-        "Re-run singleton 'alpha' (50) as the fallback while disabling rule 'gated'.",
-        "Probe lower θ values than 0.50 to find a safer operating point.",
-        "Audit the composed pipeline for unexpected interactions, data leakage, or misconfigured guards.",
-    ]
 
-    assert verdict.checklist == [
-        "Confirm objective='maximize' aligns with how J is interpreted.",
-        "Ensure 2 singleton baselines use the same dataset and evaluation seed as the composition.",
-        "Document how θ=0.50 for rule 'gated' was chosen.",
-        "Record why no pattern diagnostics were supplied.",
+def test_compute_verdict_memoisation_respects_baseline_order() -> None:
+    """
+    Bundles are frozen and hashable, and repeated bundles reuse their verdict.
+    Baseline order still matters: ties resolve to the first singleton listed,
+    so reordered (but equal) bundles must not share a cached verdict.
+    """
+    first = RunBundle(theta=0.4, rule="tie", J_baselines={"A": 1.0, "B": 1.0}, J_composed=0.5)
+    second = RunBundle(theta=0.4, rule="tie", J_baselines={"B": 1.0, "A": 1.0}, J_composed=0.5)
+
+    assert first == second and hash(first) == hash(second)
+    with pytest.raises(ValidationError):
+        first.theta = 0.9  # type: ignore[misc]
+
+    assert compute_verdict(first) == compute_verdict(first)
+    assert "singleton 'A'=1" in compute_verdict(first).recommendation
+    assert "singleton 'B'=1" in compute_verdict(second).recommendation
+
+
+def test_compute_verdict_results_do_not_share_mutable_state() -> None:
+    """Mutating one returned verdict must not leak into later results."""
+    params = dict(theta=0.3, rule="blend", J_baselines={"A": 1.0, "B": 1.2}, J_composed=0.8)
+
+    poisoned = compute_verdict(RunBundle(**params))
+    poisoned.next_tests.append("POISON")
+    poisoned.checklist.clear()
+
+    fresh = compute_verdict(RunBundle(**params))
+
+    assert fresh is not poisoned
+    assert "POISON" not in fresh.next_tests
+    assert fresh.checklist
+
+
+def test_analyze_composition_accepts_slotted_objects() -> None:
+    """Bundle-like objects using __slots__ (no instance __dict__) are readable."""
+    from gce.core.cc_surface.api import analyze_composition  # type: ignore[import-untyped]
+
+    class SlottedBundle:
+        __slots__ = ("theta", "J_baselines", "J_composed", "objective", "_cache")
+
+        def __init__(self) -> None:
+            self.theta = 0.25
+            self.J_baselines = {"A": 0.4, "B": 0.5}
+            self.J_composed = 0.2
+            self.objective = "minimize"
+
+    result = analyze_composition(SlottedBundle())
+
+    assert result["theta"] == 0.25
+    assert result["best_singleton"] == 0.4
+    assert result["CC"] == pytest.approx(0.5)
+
+
+def test_compute_verdicts_batch_matches_single_calls() -> None:
+    """Batch verdicts equal per-item verdicts, in order; bad items still raise."""
+    params_list = [
+        {"theta": 0.1 * i, "rule": "sweep", "J_baselines": {"A": 0.3, "B": 0.4}, "J_composed": 0.2 + 0.05 * i}
+        for i in range(4)
     ]
+
+    batch = compute_verdicts_batch(params_list)
+
+    assert batch == [compute_verdict(RunBundle(**params)) for params in params_list]
+
+    with pytest.raises(ValidationError):
+        compute_verdicts_batch([{"theta": 0.5, "rule": "", "J_baselines": {}, "J_composed": 0.1}])
+
+
+def test_run_bundle_normalises_and_rejects_non_finite() -> None:
+    """
+    Objectives are case-insensitive, rule labels are stripped, and non-finite
+    J values are rejected at the offending field.
+    """
+    bundle = RunBundle(
+        theta=0.5,
+        rule="  blend ",
+        J_baselines={"A": "0.4"},
+        J_composed=0.2,
+        objective=" Maximize ",
+    )
+
+    assert bundle.objective == "maximize"
+    assert bundle.rule == "blend"
+    assert bundle.J_baselines == {"A": 0.4}
+
+    with pytest.raises(ValueError) as excinfo:
+        RunBundle(theta=0.5, rule="r", J_baselines={"A": float("inf")}, J_composed=0.2)
+
+    assert "J_baselines.A" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("label", ["Constructive", "Independent", "Destructive"])
+def test_build_verdict_matches_standalone_builders(label: str) -> None:
+    """
+    The shared context used by build_verdict must not change any text
+    compared with calling each builder on its own.
+    """
+    from gce.core.cc_surface.recommend import (  # type: ignore[import-untyped]
+        build_verdict,
+        make_checklist,
+        make_next_tests,
+        make_recommendation,
+    )
+
+    bundle = RunBundle(
+        theta=0.25,
+        patterns=["prior", "denoiser"],
+        rule="blend",
+        J_baselines={"A": 0.4, "B": 0.3},
+        J_composed=0.35,
+    )
+
+    verdict = build_verdict(bundle, 1.1, label)
+
+    assert verdict.recommendation == make_recommendation(bundle, 1.1, label)
+    assert verdict.next_tests == make_next_tests(bundle, 1.1, label)
+    assert verdict.checklist == make_checklist(bundle)
+
+
+def test_trusted_bundle_round_trips_fingerprint() -> None:
+    """
+    RunBundle.trusted rebuilds an equal bundle from already-validated fields
+    without running validation.
+    """
+    bundle = RunBundle(
+        theta=0.3,
+        patterns=["prior"],
+        rule="blend",
+        J_baselines={"A": 1.0, "B": 1.2},
+        J_composed=0.8,
+    )
+
+    rebuilt = RunBundle.trusted(**bundle.model_dump())
+
+    assert rebuilt == bundle
+    assert rebuilt.fingerprint() == bundle.fingerprint()
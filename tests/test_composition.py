@@ -0,0 +1,190 @@
+"""
+Tests for gce.core.cc_surface.composition
+
+The vectorised helpers must agree with the scalar reference implementation
+row by row, including the NaN / zero-denominator edge cases.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from gce.core.cc_surface.api import (
+    analyze_composition,
+    analyze_composition_grid,
+    fh_bounds,
+    fh_bounds_vec,
+)
+from gce.core.cc_surface.composition import (
+    _OBJECTIVE_CODES,
+    _VECTORIZE_MIN_BASELINES,
+    _best_finite_value,
+    _best_singleton_value,
+    _cc_kernel,
+    compute_cc,
+    compute_cc_vec,
+)
+
+
+# ---------------------------------------------------------------------------
+# compute_cc_vec
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("objective", ["minimize", "maximize"])
+def test_compute_cc_vec_matches_scalar_rows(objective):
+    """Each row of the vectorised result equals the scalar compute_cc value."""
+    matrix = np.array(
+        [
+            [0.3, 0.4],
+            [0.0, 0.5],
+            [np.nan, 0.2],
+            [np.nan, np.inf],
+            [-1.0, 0.0],
+        ]
+    )
+    composed = np.array([0.28, 0.0, 0.1, 0.3, 0.0])
+
+    result = compute_cc_vec(matrix, composed, objective)
+
+    assert result.shape == (matrix.shape[0],)
+    for row, comp, got in zip(matrix, composed, result):
+        expected = compute_cc({f"g{i}": v for i, v in enumerate(row)}, comp, objective)
+        if math.isnan(expected):
+            assert math.isnan(got)
+        else:
+            assert got == expected
+
+
+def test_compute_cc_vec_rejects_non_matrix():
+    """A 1-D baseline array is ambiguous and should raise ValueError."""
+    with pytest.raises(ValueError) as excinfo:
+        compute_cc_vec(np.array([0.3, 0.4]), 0.2, "minimize")
+
+    assert "2-D" in str(excinfo.value)
+
+
+# ---------------------------------------------------------------------------
+# analyze_composition_grid
+# ---------------------------------------------------------------------------
+
+
+def test_grid_matches_per_bundle_analysis():
+    """The columnar grid result agrees with analyze_composition per row."""
+    thetas = [0.1, 0.5, 0.9]
+    matrix = [[0.30, 0.40], [0.20, 0.50], [0.45, 0.35]]
+    composed = [0.28, 0.25, 0.40]
+
+    grid = analyze_composition_grid(thetas, matrix, composed, "minimize")
+
+    assert grid["objective"] == "minimize"
+    for i, theta in enumerate(thetas):
+        single = analyze_composition(
+            {
+                "theta": theta,
+                "J_baselines": {"a": matrix[i][0], "b": matrix[i][1]},
+                "J_composed": composed[i],
+                "objective": "minimize",
+            }
+        )
+        assert grid["theta"][i] == single["theta"]
+        assert grid["best_singleton"][i] == single["best_singleton"]
+        assert grid["CC"][i] == pytest.approx(single["CC"])
+
+
+@pytest.mark.parametrize("objective", ["minimize", "maximize"])
+@pytest.mark.parametrize("poison", [None, math.nan, math.inf])
+def test_analyze_composition_large_mapping_matches_compute_cc(objective, poison):
+    """The NumPy reduction for large mappings agrees with the scalar path."""
+    values = [0.2 + ((i * 37) % 101) / 200.0 for i in range(_VECTORIZE_MIN_BASELINES + 1)]
+    if poison is not None:
+        values[0] = poison
+    baselines = {f"g{i}": v for i, v in enumerate(values)}
+
+    result = analyze_composition(
+        {"J_baselines": baselines, "J_composed": 0.3, "objective": objective}
+    )
+
+    expected_best = (max if objective == "maximize" else min)(values)
+    if math.isnan(expected_best):
+        assert math.isnan(result["best_singleton"])
+    else:
+        assert result["best_singleton"] == expected_best
+    assert result["CC"] == compute_cc(baselines, 0.3, objective)
+
+
+def test_analyze_composition_normalises_and_validates_objective():
+    """Objectives are case-insensitive like RunBundle's; typos fail fast."""
+    payload = {"J_baselines": {"a": 0.3, "b": 0.4}, "J_composed": 0.5, "objective": " Maximize "}
+
+    result = analyze_composition(payload)
+
+    assert result["objective"] == "maximize"
+    assert result["best_singleton"] == 0.4
+
+    with pytest.raises(ValueError) as excinfo:
+        analyze_composition({**payload, "objective": "maximise"})
+
+    assert "objective must be" in str(excinfo.value)
+
+
+# ---------------------------------------------------------------------------
+# _best_singleton_value
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("objective", ["minimize", "maximize"])
+def test_best_singleton_numpy_path_matches_python_loop(objective):
+    """Large mappings take the NumPy path and must agree with the Python loop."""
+    values = [((i * 37) % 101) / 100.0 for i in range(_VECTORIZE_MIN_BASELINES + 5)]
+    values[3] = math.nan
+    values[7] = math.inf
+    values[11] = -math.inf
+    baselines = {f"g{i}": v for i, v in enumerate(values)}
+
+    assert _best_singleton_value(baselines, objective) == _best_finite_value(values, objective)
+
+    all_nan = {f"g{i}": math.nan for i in range(_VECTORIZE_MIN_BASELINES)}
+    assert _best_singleton_value(all_nan, objective) is None
+
+
+@pytest.mark.parametrize("objective", ["minimize", "maximize"])
+@pytest.mark.parametrize(
+    "row, comp",
+    [
+        ([0.3, 0.4], 0.28),
+        ([0.0, 0.5], 0.0),
+        ([0.0, 0.5], 0.1),
+        ([np.nan, 0.2], 0.1),
+        ([np.nan, np.inf], 0.3),
+        ([-1.0, 0.0], 0.0),
+    ],
+)
+def test_cc_kernel_matches_compute_cc(objective, row, comp):
+    """The Numba-compilable kernel reproduces compute_cc, edge cases included."""
+    got = _cc_kernel(np.asarray(row, dtype=np.float64), comp, _OBJECTIVE_CODES[objective])
+    expected = compute_cc({f"g{i}": v for i, v in enumerate(row)}, comp, objective)
+
+    if math.isnan(expected):
+        assert math.isnan(got)
+    else:
+        assert got == expected
+
+
+# ---------------------------------------------------------------------------
+# fh_bounds_vec
+# ---------------------------------------------------------------------------
+
+
+def test_fh_bounds_vec_matches_scalar_bounds():
+    """Each row equals the scalar bounds, including clipping at 0 and 1."""
+    thetas = np.array([0.0, 0.02, 0.5, 0.97, 1.0, 1.3])
+
+    result = fh_bounds_vec(thetas, -0.05)
+
+    assert result.shape == (thetas.shape[0], 2)
+    for theta, row in zip(thetas, result):
+        assert tuple(row) == fh_bounds(float(theta), 0.05)
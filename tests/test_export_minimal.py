@@ -1,31 +1,15 @@
 from __future__ import annotations
 
-import importlib
 import json
 from pathlib import Path
+from uuid import uuid4
 
-from gce.exporters import one_pager
-from tests.utils import load_sample_bundle, reset_backend_modules
-
-
-def _compute_sample_verdict():
-    """
-    Reload the CC-surface API using a clean module state and compute a sample verdict.
+import pytest
 
-    This ensures:
-    - The backend selection logic (fallback vs cc-framework) is exercised.
-    - We always use the same canonical sample bundle for all exporter tests.
-    """
-    reset_backend_modules()
-    import gce.core.cc_surface.api as api  # local import to respect reset
-
-    importlib.reload(api)
-    bundle = load_sample_bundle()
-    verdict = api.compute_verdict_from_params(**bundle)
-    return bundle, verdict
+from gce.exporters import one_pager
 
 
-def test_render_contains_sections():
+def test_render_contains_sections(sample_verdict):
     """
     Basic smoke test: the text one-pager should contain key sections and content.
 
@@ -36,7 +20,7 @@ def test_render_contains_sections():
     - The verdict label appears.
     - Both "Next Tests" and "Checklist" section headers are present.
     """
-    bundle, verdict = _compute_sample_verdict()
+    bundle, verdict = sample_verdict
     report = one_pager.render_text_report(bundle, verdict)
 
     assert "Guardrail One-Pager" in report
@@ -49,7 +33,7 @@ def test_render_contains_sections():
     assert report.endswith("\n")
 
 
-def test_export_roundtrip(tmp_path: Path):
+def test_export_roundtrip(exports_dir: Path, sample_verdict):
     """
     Export a text one-pager to disk and ensure the contents match render_text_report.
 
@@ -57,18 +41,18 @@ def test_export_roundtrip(tmp_path: Path):
     - export_one_pager respects the target path.
     - The written file is a pure text representation of render_text_report.
     """
-    bundle, verdict = _compute_sample_verdict()
+    bundle, verdict = sample_verdict
     expected = one_pager.render_text_report(bundle, verdict)
 
-    target = tmp_path / "bundle.txt"
+    target = exports_dir / f"bundle_{uuid4().hex}.txt"
     path = one_pager.export_one_pager(bundle, verdict, target)
 
     assert path == target
     assert target.exists()
-    assert target.read_text() == expected
+    assert target.read_text(encoding="utf-8") == expected
 
 
-def test_build_payload_is_json_ready():
+def test_build_payload_is_json_ready(sample_verdict):
     """
     build_payload should produce a fully JSON-serialisable dict.
 
@@ -76,7 +60,7 @@ def test_build_payload_is_json_ready():
     - bundle + verdict are embedded under the expected keys.
     - json.dumps succeeds without needing custom encoders.
     """
-    bundle, verdict = _compute_sample_verdict()
+    bundle, verdict = sample_verdict
     payload = one_pager.build_payload(bundle, verdict)
 
     # Structural expectations
@@ -90,7 +74,7 @@ def test_build_payload_is_json_ready():
     assert '"verdict"' in json_blob
 
 
-def test_verdict_to_json_embeds_bundle_and_metadata():
+def test_verdict_to_json_embeds_bundle_and_metadata(sample_verdict):
     """
     verdict_to_json should include verdict, optional bundle, and optional metadata.
 
@@ -98,7 +82,7 @@ def test_verdict_to_json_embeds_bundle_and_metadata():
     - The JSON parses back to a dict.
     - The metadata keys are present when provided.
     """
-    bundle, verdict = _compute_sample_verdict()
+    bundle, verdict = sample_verdict
     meta = {"source": "pytest", "kind": "unit-test"}
 
     json_blob = one_pager.verdict_to_json(
@@ -114,7 +98,25 @@ def test_verdict_to_json_embeds_bundle_and_metadata():
     assert "generated_at" in parsed
 
 
-def test_verdict_to_pdf_creates_nonempty_pdf(tmp_path: Path):
+def test_build_payload_timestamp_default_and_override(sample_verdict):
+    """
+    generated_at defaults to a parseable UTC timestamp and can be pinned so a
+    batch of exports shares one value.
+    """
+    from datetime import datetime
+
+    bundle, verdict = sample_verdict
+
+    default = one_pager.build_payload(bundle, verdict)["generated_at"]
+    assert datetime.fromisoformat(default).utcoffset().total_seconds() == 0
+
+    pinned = "2024-01-01T00:00:00+00:00"
+    parsed = json.loads(one_pager.verdict_to_json(verdict, bundle=bundle, generated_at=pinned))
+    assert parsed["generated_at"] == pinned
+
+
+@pytest.mark.slow
+def test_verdict_to_pdf_creates_nonempty_pdf(sample_pdf: Path):
     """
     verdict_to_pdf should create a single PDF file with non-zero size.
 
@@ -124,11 +126,47 @@ def test_verdict_to_pdf_creates_nonempty_pdf(tmp_path: Path):
     - It has a .pdf suffix.
     - It has non-zero length.
     """
-    _, verdict = _compute_sample_verdict()
-    target = tmp_path / "verdict.pdf"
+    # The fixture asked for <tmp>/exports*/verdict.pdf.
+    assert sample_pdf.name == "verdict.pdf"
+    assert sample_pdf.parent.name.startswith("exports")
+    assert sample_pdf.exists()
+    assert sample_pdf.suffix.lower() == ".pdf"
+    assert sample_pdf.stat().st_size > 0
 
-    path = one_pager.verdict_to_pdf(verdict, output_path=target)
-    assert path == target
-    assert path.exists()
-    assert path.suffix.lower() == ".pdf"
-    assert path.stat().st_size > 0
+
+def test_wrap_text_respects_width_and_keeps_words():
+    """
+    _wrap_text packs words greedily against their rendered Helvetica 11 width
+    and never splits a word, even one wider than the line.
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+
+    def width(line: str) -> float:
+        return stringWidth(line, "Helvetica", 11)
+
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "W" * 30]
+    max_width = width("alpha beta gamma")
+    lines = one_pager._wrap_text(" ".join(words), max_width)
+
+    assert lines == ["alpha beta gamma", "delta epsilon", "W" * 30]
+    for line, nxt in zip(lines, lines[1:]):
+        assert width(line + " " + nxt.split()[0]) > max_width
+    assert one_pager._wrap_text("", 100.0) == [""]
+
+
+@pytest.mark.slow
+def test_verdict_to_pdf_bytes_matches_written_file(exports_dir: Path, sample_verdict):
+    """
+    verdict_to_pdf_bytes returns the same document verdict_to_pdf writes,
+    without touching the filesystem.
+    """
+    _, verdict = sample_verdict
+    stamp = "2024-01-01T00:00:00+00:00"
+
+    data = one_pager.verdict_to_pdf_bytes(verdict, generated_at=stamp)
+    path = one_pager.verdict_to_pdf(
+        verdict, output_path=exports_dir / f"verdict_{uuid4().hex}.pdf", generated_at=stamp
+    )
+
+    assert data.startswith(b"%PDF")
+    assert len(data) == path.stat().st_size
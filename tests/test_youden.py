@@ -19,59 +19,39 @@ import pytest
 
 from gce.core.cc_surface.youden import youden_j
 
+# Substrings the broadcast error must contain: the reason and both shapes.
+_BROADCAST_TOKENS = ("not broadcastable", "(2,)", "(3,)")
+
 
 # ---------------------------------------------------------------------------
 # Scalar behaviour and return type
 # ---------------------------------------------------------------------------
 
 
-def test_scalar_inputs_return_python_float():
-    """Two Python scalars should yield a Python float, not a 0-d ndarray."""
-    result = youden_j(0.9, 0.1)
-    assert isinstance(result, float)
-    assert result == pytest.approx(0.8)
-
-
-def test_scalar_int_inputs_are_accepted_and_return_float():
-    """Integer scalars should be accepted and behave like floats."""
-    result = youden_j(1, 0)  # raw = 1, already in-range
-    assert isinstance(result, float)
-    assert result == pytest.approx(1.0)
-
-
-def test_numpy_scalar_is_treated_as_scalar():
-    """
-    NumPy scalar inputs (e.g., np.float64) are treated as scalars too:
-    if both arguments are scalar-like, return a Python float.
+@pytest.mark.parametrize(
+    "tpr, fpr, expected",
+    [
+        pytest.param(0.9, 0.1, 0.9 - 0.1, id="python-floats"),
+        # Integer scalars are accepted and behave like floats (raw = 1, in range).
+        pytest.param(1, 0, 1.0, id="python-ints"),
+        # NumPy scalars are treated as scalars too (np.isscalar on both).
+        pytest.param(np.float64(0.9), 0.1, 0.9 - 0.1, id="numpy-scalar"),
+        # Raw diff = 2.5, but finite values are clipped to 1.0.
+        pytest.param(2.0, -0.5, 1.0, id="clip-above-one"),
+        # Raw diff = -2.0, but finite values are clipped to -1.0.
+        pytest.param(-0.5, 1.5, -1.0, id="clip-below-minus-one"),
+    ],
+)
+def test_scalar_inputs_return_clipped_python_float(tpr, fpr, expected):
+    """
+    Two scalar-like inputs yield a Python float (not a 0-d ndarray), with
+    finite differences clipped to [-1, 1].
     """
-    tpr = np.float64(0.9)
-    fpr = 0.1  # pure Python float
-
     result = youden_j(tpr, fpr)
-
-    # Implementation uses np.isscalar(...) for both → scalar path.
-    assert isinstance(result, float)
-    assert result == pytest.approx(0.8)
-
-
-def test_scalar_clipping_above_one():
-    """
-    If tpr - fpr > 1 for finite inputs, the result must be clipped to 1.0.
-    """
-    # Raw diff = 2.5, but finite values are clipped to 1.0
-    result = youden_j(2.0, -0.5)
     assert isinstance(result, float)
-    assert result == pytest.approx(1.0)
-
-
-def test_scalar_clipping_below_minus_one():
-    """
-    If tpr - fpr < -1 for finite inputs, the result must be clipped to -1.0.
-    """
-    # Raw diff = -2.0, but finite values are clipped to -1.0
-    result = youden_j(-0.5, 1.5)
-    assert isinstance(result, float)
-    assert result == pytest.approx(-1.0)
+    # The expectations are computed with the same float arithmetic, so the
+    # comparison is exact.
+    assert result == expected
 
 
 # ---------------------------------------------------------------------------
@@ -79,95 +59,42 @@ def test_scalar_clipping_below_minus_one():
 # ---------------------------------------------------------------------------
 
 
-def test_array_same_shape_returns_ndarray():
-    """Arrays of the same shape should produce an ndarray of that shape."""
-    tpr = np.array([0.8, 0.9, 0.95])
-    fpr = np.array([0.3, 0.1, 0.05])
-
-    result = youden_j(tpr, fpr)
-
-    assert isinstance(result, np.ndarray)
-    assert result.shape == tpr.shape
-    expected = tpr - fpr
-    expected = np.clip(expected, -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
-
-
-def test_broadcast_vector_and_scalar():
-    """
-    When one argument is a 1-D array and the other is a scalar, broadcasting
-    should align with NumPy semantics.
-    """
-    tpr = np.array([0.2, 0.5, 0.9])
-    fpr = 0.1
-
-    result = youden_j(tpr, fpr)
-
-    assert isinstance(result, np.ndarray)
-    assert result.shape == tpr.shape
-    expected = np.clip(tpr - fpr, -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
-
-
-def test_broadcast_scalar_and_vector():
-    """Symmetric case: scalar TPR, vector FPR."""
-    tpr = 0.9
-    fpr = np.array([0.1, 0.2, 0.3])
-
-    result = youden_j(tpr, fpr)
-
-    assert isinstance(result, np.ndarray)
-    assert result.shape == fpr.shape
-    expected = np.clip(tpr - fpr, -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
-
-
-def test_broadcast_2d_and_1d():
-    """
-    A 2-D array and a 1-D array that broadcast under NumPy rules should be
-    handled correctly (e.g., (2, 3) with (3,)).
+def _array_case(tpr, fpr, expected_shape, id):
+    """pytest.param with clip(tpr - fpr, -1, 1) precomputed at import time."""
+    expected = np.clip(np.asarray(tpr, dtype=float) - np.asarray(fpr, dtype=float), -1.0, 1.0)
+    return pytest.param(tpr, fpr, expected_shape, expected, id=id)
+
+
+@pytest.mark.parametrize(
+    "tpr, fpr, expected_shape, expected",
+    [
+        _array_case(
+            np.array([0.8, 0.9, 0.95]), np.array([0.3, 0.1, 0.05]), (3,), id="same-shape"
+        ),
+        _array_case(np.array([0.2, 0.5, 0.9]), 0.1, (3,), id="vector-and-scalar"),
+        _array_case(0.9, np.array([0.1, 0.2, 0.3]), (3,), id="scalar-and-vector"),
+        # (2, 3) with (3,) broadcasts under NumPy rules.
+        _array_case(
+            np.array([[0.8, 0.9, 1.1], [0.1, 0.2, 0.3]]),
+            np.array([0.2, 0.3, 0.4]),
+            (2, 3),
+            id="2d-and-1d",
+        ),
+        # Python lists still yield an ndarray when an argument is non-scalar.
+        _array_case([0.8, 0.9], [0.1, 0.2], (2,), id="lists"),
+        _array_case([0.1, 0.4, 0.7], np.array([0.2, 0.2, 0.2]), (3,), id="list-and-array"),
+    ],
+)
+def test_array_inputs_broadcast_to_clipped_ndarray(tpr, fpr, expected_shape, expected):
+    """
+    When at least one argument is non-scalar, the result is an ndarray whose
+    shape follows NumPy broadcasting, holding clip(tpr - fpr, -1, 1).
     """
-    tpr = np.array([[0.8, 0.9, 1.1], [0.1, 0.2, 0.3]])
-    fpr = np.array([0.2, 0.3, 0.4])
-
-    result = youden_j(tpr, fpr)
-
-    assert isinstance(result, np.ndarray)
-    assert result.shape == tpr.shape
-    expected = np.clip(tpr - fpr, -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
-
-
-def test_list_inputs_return_ndarray():
-    """
-    Using Python lists/tuples should still yield a numpy.ndarray when at
-    least one argument is non-scalar.
-    """
-    tpr = [0.8, 0.9]
-    fpr = [0.1, 0.2]
-
-    result = youden_j(tpr, fpr)
-
-    assert isinstance(result, np.ndarray)
-    assert result.shape == (2,)
-    expected = np.clip(np.array(tpr) - np.array(fpr), -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
-
-
-def test_mixed_list_and_array_inputs():
-    """
-    Mixed container types (list + ndarray, tuple + ndarray) should work and
-    broadcast as expected.
-    """
-    tpr = [0.1, 0.4, 0.7]
-    fpr = np.array([0.2, 0.2, 0.2])
-
     result = youden_j(tpr, fpr)
 
     assert isinstance(result, np.ndarray)
-    assert result.shape == (3,)
-    expected = np.clip(np.array(tpr, dtype=float) - fpr, -1.0, 1.0)
-    np.testing.assert_allclose(result, expected)
+    assert result.shape == expected_shape
+    np.testing.assert_array_equal(result, expected)
 
 
 # ---------------------------------------------------------------------------
@@ -189,7 +116,7 @@ def test_nan_and_inf_are_preserved():
     assert result.shape == (4,)
 
     # Index 0: finite → clipped (but still 0.8 here)
-    assert result[0] == pytest.approx(0.8)
+    assert result[0] == 0.9 - 0.1
 
     # Index 1: NaN preserved
     assert math.isnan(result[1])
@@ -209,11 +136,11 @@ def test_all_finite_outputs_within_closed_interval():
     t_values = np.linspace(-2.0, 2.0, num=21)
     f_values = np.linspace(-2.0, 2.0, num=21)
 
-    t_grid, f_grid = np.meshgrid(t_values, f_values, indexing="ij")
-    result = youden_j(t_grid, f_grid)
+    # Broadcast a column against a row instead of materialising a meshgrid.
+    result = youden_j(t_values[:, None], f_values[None, :])
 
     assert isinstance(result, np.ndarray)
-    assert result.shape == t_grid.shape
+    assert result.shape == (21, 21)
 
     # All finite outputs must lie in [-1, 1] up to tiny numerical slack.
     assert np.all(result <= 1.0 + 1e-12)
@@ -268,6 +195,4 @@ def test_non_broadcastable_shapes_raise_valueerror():
         youden_j(tpr, fpr)
 
     msg = str(excinfo.value)
-    assert "not broadcastable" in msg
-    # crude but ensures shapes are mentioned
-    assert "2" in msg and "3" in msg
+    assert all(token in msg for token in _BROADCAST_TOKENS), msg
@@ -0,0 +1,174 @@
+"""
+Tests for gce.core.cc_surface.metrics threshold scanning.
+
+`compute_youden_curve` counts decisions by binary search over sorted scores;
+these tests pin it against the direct definition (mean of thresholded
+decisions) on random and tie-heavy inputs.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from gce.core.cc_surface.metrics import (
+    _merge_counts,
+    compute_youden_curve,
+    optimal_youden_threshold,
+    optimal_youden_thresholds_batch,
+)
+
+
+def _brute_force_rates(s0, s1, thresholds, higher_scores_leakier):
+    thr = np.asarray(thresholds)[:, None]
+    if higher_scores_leakier:
+        return (s1[None, :] >= thr).mean(axis=1), (s0[None, :] >= thr).mean(axis=1)
+    return (s1[None, :] <= thr).mean(axis=1), (s0[None, :] <= thr).mean(axis=1)
+
+
+@pytest.mark.parametrize("higher_scores_leakier", [True, False])
+@pytest.mark.parametrize("rounding", [None, 1])
+def test_curve_matches_brute_force(higher_scores_leakier, rounding):
+    """TPR/FPR equal the thresholded-mean definition, ties included."""
+    rng = np.random.default_rng(0)
+    s0 = rng.normal(0.0, 1.0, size=300)
+    s1 = rng.normal(0.8, 1.0, size=200)
+    if rounding is not None:
+        s0, s1 = np.round(s0, rounding), np.round(s1, rounding)
+
+    curve = compute_youden_curve(s0, s1, higher_scores_leakier=higher_scores_leakier)
+
+    np.testing.assert_array_equal(curve.thresholds, np.unique(np.concatenate([s0, s1])))
+    tpr, fpr = _brute_force_rates(s0, s1, curve.thresholds, higher_scores_leakier)
+    np.testing.assert_array_equal(curve.tpr, tpr)
+    np.testing.assert_array_equal(curve.fpr, fpr)
+    np.testing.assert_array_equal(curve.j, tpr - fpr)
+
+
+def test_explicit_thresholds_outside_score_range():
+    """Explicit grids are deduplicated/sorted and may extend past the scores."""
+    s0 = np.array([0.1, 0.2, 0.2, 0.4])
+    s1 = np.array([0.3, 0.5, 0.9])
+
+    curve = compute_youden_curve(s0, s1, thresholds=[1.5, -1.0, 0.2, 0.2, 0.45])
+
+    np.testing.assert_array_equal(curve.thresholds, [-1.0, 0.2, 0.45, 1.5])
+    tpr, fpr = _brute_force_rates(s0, s1, curve.thresholds, True)
+    np.testing.assert_array_equal(curve.tpr, tpr)
+    np.testing.assert_array_equal(curve.fpr, fpr)
+
+
+def test_optimal_threshold_on_separable_scores():
+    """Perfectly separated worlds reach J = 1 at the smallest W1 score."""
+    best_j, best_threshold, _ = optimal_youden_threshold([0.1, 0.2, 0.3], [0.6, 0.7])
+
+    assert best_j == pytest.approx(1.0)
+    assert best_threshold == pytest.approx(0.6)
+
+
+@pytest.mark.parametrize("higher_scores_leakier", [True, False])
+@pytest.mark.parametrize("thresholds", [None, np.linspace(-3.0, 3.0, 61)])
+def test_drop_dominated_preserves_optimum(higher_scores_leakier, thresholds):
+    """Dropping dominated thresholds shrinks the curve but not the optimum."""
+    rng = np.random.default_rng(1)
+    s0 = np.round(rng.normal(0.0, 1.0, size=400), 2)
+    s1 = np.round(rng.normal(1.5, 1.0, size=400), 2)
+
+    full = optimal_youden_threshold(
+        s0, s1, thresholds=thresholds, higher_scores_leakier=higher_scores_leakier
+    )
+    pruned = optimal_youden_threshold(
+        s0,
+        s1,
+        thresholds=thresholds,
+        higher_scores_leakier=higher_scores_leakier,
+        drop_dominated=True,
+    )
+
+    assert pruned[:2] == full[:2]
+    assert pruned[2].thresholds.size < full[2].thresholds.size
+    # Every kept point is a point of the full curve.
+    kept = np.searchsorted(full[2].thresholds, pruned[2].thresholds)
+    np.testing.assert_array_equal(full[2].tpr[kept], pruned[2].tpr)
+    np.testing.assert_array_equal(full[2].fpr[kept], pruned[2].fpr)
+
+
+@pytest.mark.parametrize("side_right", [False, True])
+def test_merge_counts_matches_searchsorted(side_right):
+    """The Numba-compilable merge kernel reproduces np.searchsorted."""
+    rng = np.random.default_rng(2)
+    scores = np.sort(np.round(rng.normal(size=500), 1))
+    thresholds = np.unique(np.concatenate([scores, [-10.0, 10.0], rng.normal(size=50)]))
+
+    counts = _merge_counts(scores, thresholds, side_right)
+
+    expected = np.searchsorted(scores, thresholds, side="right" if side_right else "left")
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_optimal_threshold_ties_ignore_float_noise():
+    """
+    J = 1.0 - 0.9 at 0.09 and 0.1 - 0.0 at 0.99 differ only in the last ulp;
+    the smallest tied threshold must still win.
+    """
+    s0 = [0.18, 0.96, 0.8, 0.48, 0.81, 0.6, 0.66, 0.91, 0.07, 0.83]
+    s1 = [0.38, 0.33, 0.99, 0.78, 0.49, 0.42, 0.88, 0.09, 0.71, 0.79]
+
+    best_j, best_threshold, curve = optimal_youden_threshold(s0, s1)
+
+    assert best_j == pytest.approx(curve.j.max(), abs=1e-12)
+    assert best_threshold == 0.09
+
+
+def test_float32_mode_keeps_dtype_and_optimum():
+    """dtype=float32 halves the arrays and finds the same optimum on typical data."""
+    rng = np.random.default_rng(3)
+    s0 = np.round(rng.normal(0.0, 1.0, size=2000), 3)
+    s1 = np.round(rng.normal(1.0, 1.0, size=2000), 3)
+
+    best64 = optimal_youden_threshold(s0, s1)
+    best32 = optimal_youden_threshold(s0, s1, dtype=np.float32)
+
+    curve = best32[2]
+    assert curve.thresholds.dtype == curve.tpr.dtype == curve.j.dtype == np.float32
+    assert best32[0] == pytest.approx(best64[0], abs=1e-6)
+    assert best32[1] == pytest.approx(best64[1], abs=1e-6)
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf, -np.inf])
+def test_non_finite_scores_are_rejected(bad):
+    """Non-finite scores anywhere in either world raise ValueError."""
+    with pytest.raises(ValueError, match="scores_w0 contains non-finite"):
+        compute_youden_curve([0.1, bad, 0.3], [0.5])
+    with pytest.raises(ValueError, match="scores_w1 contains non-finite"):
+        compute_youden_curve([0.1], [0.5, bad, 0.2])
+
+
+def test_to_records_packs_rows():
+    """to_records returns one row per threshold with the curve's values."""
+    curve = compute_youden_curve([0.1, 0.4, 0.35], [0.8, 0.4, 0.6])
+
+    records = curve.to_records()
+
+    assert records.dtype.names == ("threshold", "tpr", "fpr", "j")
+    np.testing.assert_array_equal(records["threshold"], curve.thresholds)
+    np.testing.assert_array_equal(records["j"], curve.j)
+    assert tuple(records[0]) == (curve.thresholds[0], curve.tpr[0], curve.fpr[0], curve.j[0])
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_batch_matches_individual_calls(max_workers):
+    """Batch results equal per-pair calls, in input order."""
+    rng = np.random.default_rng(4)
+    pairs = [
+        (rng.normal(0.0, 1.0, size=n0), rng.normal(shift, 1.0, size=n1))
+        for n0, n1, shift in [(50, 80, 0.5), (300, 120, 2.0), (10, 10, -1.0)]
+    ]
+
+    batch = optimal_youden_thresholds_batch(pairs, max_workers=max_workers)
+
+    assert len(batch) == len(pairs)
+    for (s0, s1), (best_j, best_threshold, curve) in zip(pairs, batch):
+        expected = optimal_youden_threshold(s0, s1)
+        assert (best_j, best_threshold) == expected[:2]
+        np.testing.assert_array_equal(curve.j, expected[2].j)
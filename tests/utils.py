@@ -1,16 +1,28 @@
 from __future__ import annotations
 
+import copy
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 SAMPLE_BUNDLE = Path(__file__).resolve().parents[1] / "examples" / "sample_run_bundle.json"
 
 
-def load_sample_bundle() -> dict:
+@lru_cache(maxsize=1)
+def _sample_bundle_dict() -> dict:
     return json.loads(SAMPLE_BUNDLE.read_text())
 
 
+def load_sample_bundle() -> dict:
+    # Read and parse once per session; hand out copies so callers may mutate.
+    return copy.deepcopy(_sample_bundle_dict())
+
+
+# Modules whose import-time state decides the CC backend (fallback vs cc-framework).
+_BACKEND_MODULES = ("gce.core.cc_surface.api", "cc.core.api", "cc.core", "cc")
+
+
 def reset_backend_modules() -> None:
-    for name in ["gce.core.cc_surface.api", "cc.core.api", "cc.core", "cc"]:
+    for name in _BACKEND_MODULES:
         sys.modules.pop(name, None)